@@ -5,15 +5,17 @@ Modular architecture with separate packages for UI, features, core, and utilitie
 """
 import tkinter as tk
 from tkinter import messagebox, filedialog, scrolledtext
-import threading
+import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional
 
 # Import from local modules
 from ui import ToolTip, MainWindowUI, ProjectCardManager
 from core import ProjectScanner
-from features import QuickRunFeature, LauncherGenerator, AdvancedModeFeature, InspectModeFeature
-from utils import DependencyManager
+import features  # feature classes load lazily on first use
+from utils import DependencyManager, dep_cache, mph_client
 
 
 class ComsolProjectManager:
@@ -46,10 +48,29 @@ class ComsolProjectManager:
         # Application state
         self.projects = {}
         self.selected_project = None
-
-        # Check dependencies
-        self.mph_available = self.dep_manager.check_mph_available()
-        self.uv_available = self.dep_manager.check_uv_available()
+        self.selected_project_info = None
+        self._help_dialog = None
+        self._quick_run = None
+
+        # Shared pool for background scans and installs
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="comsol-bg")
+
+        # One scan at a time (scans share the scanner's cache and cache
+        # file); requests made meanwhile collapse into one follow-up scan
+        self._scan_running = False
+        self._rescan_requested = False
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Install jobs run one at a time; results come back through a
+        # queue drained on the Tk thread
+        self._pending_installs = deque()
+        self._install_results = queue.Queue()
+        self._installs_in_flight = set()
+
+        # Check dependencies (cached across launches)
+        dep_status = dep_cache.probe()
+        self.mph_available = dep_status.mph
+        self.uv_available = dep_status.uv
 
         # Initialize UI
         self._setup_ui()
@@ -80,26 +101,85 @@ class ComsolProjectManager:
             'refresh_projects': self.scan_projects
         }
 
-        # Build UI and get scrollable frame
-        scrollable_frame = self.ui.setup(callbacks)
+        # Build UI and get the project canvas
+        canvas = self.ui.setup(callbacks)
 
         # Initialize project card manager
         self.card_manager = ProjectCardManager(
-            scrollable_frame,
+            canvas,
+            self.ui.scrollbar,
             self._on_project_selected
         )
 
     def scan_projects(self):
-        """Scan projects directory for .mph files"""
-        # Clear existing cards
-        self.card_manager.clear()
-        self.projects = {}
-        self.selected_project = None
+        """Scan projects directory for .mph files in a background thread"""
+        # Existing cards stay visible until the results are diffed in
+        if not self.projects:
+            self.card_manager.clear()
+            self.card_manager.show_empty_state("Scanning for projects...")
+
+        if self._scan_running:
+            self._rescan_requested = True
+            return
+        self._scan_running = True
+
+        # Walk the filesystem off the Tk thread, then update cards on it
+        scanner = self.project_scanner
+        self._executor.submit(
+            lambda: self.root.after(
+                0, self._apply_scan_results, scanner, self._scan_worker(scanner)
+            )
+        )
 
-        # Scan for projects
-        self.projects = self.project_scanner.scan_projects()
+    def _scan_worker(self, scanner: ProjectScanner) -> Dict:
+        """
+        Run the filesystem scan (worker thread - no Tk calls).
+
+        Args:
+            scanner: Scanner to run
+
+        Returns:
+            Dictionary mapping project names to project metadata
+        """
+        try:
+            return scanner.scan_projects()
+        except Exception:
+            return {}
+
+    def _apply_scan_results(self, scanner: ProjectScanner, projects: Dict):
+        """
+        Display scan results (Tk thread only).
+
+        Args:
+            scanner: Scanner that produced the results
+            projects: Dictionary mapping project names to project metadata
+        """
+        self._scan_running = False
+
+        # A newer scan was requested while this one ran, so its result may
+        # already be stale (Refresh, or a different folder); rescan instead
+        if self._rescan_requested:
+            self._rescan_requested = False
+            self.scan_projects()
+            return
+
+        # Ignore results from a scan of a folder that is no longer shown
+        if scanner is not self.project_scanner:
+            return
+
+        old_projects = self.projects
+        self.projects = projects
+
+        # Drop the selection if its project disappeared
+        if self.selected_project and self.selected_project not in projects:
+            self.selected_project = None
+            self.selected_project_info = None
+            self.ui.disable_action_buttons()
+        elif self.selected_project:
+            self.selected_project_info = projects[self.selected_project]
 
         if not self.projects:
+            self.card_manager.clear()
             if not self.projects_path.exists():
                 self.card_manager.show_empty_state("Projects folder not found")
             else:
@@ -108,29 +188,37 @@ class ComsolProjectManager:
                 )
             return
 
-        # Create cards
-        for project_name, project_info in self.projects.items():
-            self.card_manager.create_card(project_name, project_info)
+        if not old_projects:
+            # Nothing displayed yet - build every card in one batch
+            self.card_manager.clear()
+            self.card_manager.create_cards_batch(self.projects.items())
+            return
+
+        # Incremental update: only cards whose rows or files changed are touched
+        self.card_manager.hide_empty_state()
+        self.card_manager.update(projects)
 
-    def _on_project_selected(self, project_name: str):
+    def _on_project_selected(self, project_name: str, project_info: Dict):
         """
         Handle project selection.
 
         Args:
             project_name: Name of selected project
+            project_info: Metadata of selected project
         """
         self.selected_project = project_name
+        self.selected_project_info = project_info
         self.ui.enable_action_buttons()
 
     def _on_quick_run(self):
         """Handle quick run button click"""
-        if not self.selected_project:
+        project_info = self.selected_project_info
+        if not project_info:
             return
 
-        project_info = self.projects[self.selected_project]
-
-        # Create and run quick run feature
-        quick_run = QuickRunFeature(self.root, self.base_path)
+        # Keep one quick run feature so its progress window is reused
+        if self._quick_run is None:
+            self._quick_run = features.QuickRunFeature(self.root, self.base_path)
 
         def on_complete():
             self.ui.enable_action_buttons()
@@ -138,32 +226,32 @@ class ComsolProjectManager:
         # Temporarily disable buttons
         self.ui.disable_action_buttons()
 
-        quick_run.run(project_info, on_complete)
+        self._quick_run.run(project_info, on_complete)
 
     def _on_create_launcher(self):
         """Handle create launcher button click"""
-        if not self.selected_project:
+        project_info = self.selected_project_info
+        if not project_info:
             return
 
-        project_info = self.projects[self.selected_project]
-        LauncherGenerator.generate(project_info)
+        features.LauncherGenerator.generate(project_info, self.root)
 
     def _on_advanced_mode(self):
         """Handle advanced mode button click"""
-        if not self.selected_project:
+        project_info = self.selected_project_info
+        if not project_info:
             return
 
-        project_info = self.projects[self.selected_project]
-        advanced_mode = AdvancedModeFeature(self.root, project_info)
+        advanced_mode = features.AdvancedModeFeature(self.root, project_info)
         advanced_mode.show()
 
     def _on_inspect_mode(self):
         """Handle inspect & edit button click"""
-        if not self.selected_project:
+        project_info = self.selected_project_info
+        if not project_info:
             return
 
-        project_info = self.projects[self.selected_project]
-        inspect_mode = InspectModeFeature(self.root, project_info)
+        inspect_mode = features.InspectModeFeature(self.root, project_info)
         inspect_mode.show()
 
     def _browse_folder(self):
@@ -175,60 +263,103 @@ class ComsolProjectManager:
         if folder:
             self.projects_path = Path(folder)
             self.project_scanner = ProjectScanner(self.projects_path)
+            # Different folder - start from an empty card list
+            self.projects = {}
+            self.selected_project = None
+            self.selected_project_info = None
+            self.ui.disable_action_buttons()
             self.scan_projects()
 
     def _install_uv(self):
         """Install UV package manager"""
-        def install():
-            try:
-                success = self.dep_manager.install_uv_with_pip()
-                if success:
-                    self.root.after(0, lambda: messagebox.showinfo(
-                        "Success",
-                        "UV installed!\n\nRestart the application."
-                    ))
-                else:
-                    self.root.after(0, lambda: messagebox.showerror(
-                        "Error",
-                        "Installation failed"
-                    ))
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror(
-                    "Error",
-                    f"Installation failed:\n{str(e)}"
-                ))
-
-        threading.Thread(target=install, daemon=True).start()
+        self._submit_install("uv")
 
     def _install_mph(self):
         """Install mph library"""
-        def install():
-            try:
+        self._submit_install("mph")
+
+    def _submit_install(self, job: str):
+        """
+        Queue an install job unless the same job is already running.
+
+        Args:
+            job: Job id ("uv" or "mph")
+        """
+        if job in self._installs_in_flight:
+            return
+        self._installs_in_flight.add(job)
+        self._pending_installs.append(job)
+        self.ui.set_install_busy(job, True)
+        if len(self._installs_in_flight) == 1:
+            self._start_next_install()
+            self.root.after(100, self._drain_install_queue)
+
+    def _start_next_install(self):
+        """Hand the next pending install job to the background pool"""
+        job = self._pending_installs.popleft()
+        self._executor.submit(self._run_install, job)
+
+    def _run_install(self, job: str):
+        """
+        Run one install job (worker thread - no Tk calls).
+
+        Args:
+            job: Job id ("uv" or "mph")
+        """
+        try:
+            if job == "uv":
+                success = self.dep_manager.install_uv_with_pip()
+                message = "UV installed!\n\nRestart the application."
+            else:
                 if self.uv_available:
                     self.dep_manager.setup_uv_environment(self.base_path)
+                    success = True
                 else:
                     success = self.dep_manager.install_mph_with_pip()
-                    if not success:
-                        self.root.after(0, lambda: messagebox.showerror(
-                            "Error",
-                            "Installation failed"
-                        ))
-                        return
-
-                self.root.after(0, lambda: messagebox.showinfo(
-                    "Success",
-                    "mph installed!\n\nRestart the application."
-                ))
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror(
-                    "Error",
-                    f"Installation failed:\n{str(e)}"
-                ))
-
-        threading.Thread(target=install, daemon=True).start()
+                message = "mph installed!\n\nRestart the application."
+
+            if success:
+                dep_cache.invalidate()
+            else:
+                message = "Installation failed"
+        except Exception as e:
+            success = False
+            message = f"Installation failed:\n{str(e)}"
+
+        self._install_results.put((job, success, message))
+
+    def _drain_install_queue(self):
+        """Report finished install jobs and start queued ones (Tk thread)"""
+        while True:
+            try:
+                job, success, message = self._install_results.get_nowait()
+            except queue.Empty:
+                break
+            self._installs_in_flight.discard(job)
+            self.ui.set_install_busy(job, False)
+            if self._pending_installs:
+                self._start_next_install()
+            if success:
+                messagebox.showinfo("Success", message)
+            else:
+                messagebox.showerror("Error", message)
+
+        if self._installs_in_flight:
+            self.root.after(100, self._drain_install_queue)
+
+    def _on_close(self):
+        """Shut down the background pool and Comsol client, then close the window"""
+        self._executor.shutdown(wait=False)
+        mph_client.shutdown()
+        self.root.destroy()
 
     def _show_help(self):
-        """Show help dialog"""
+        """Show help dialog (built once, then shown/hidden)"""
+        if self._help_dialog is not None and self._help_dialog.winfo_exists():
+            self._help_dialog.deiconify()
+            self._help_dialog.lift()
+            return
+
         help_text = """COMSOL PROJECT MANAGER
 
 QUICK START:
@@ -263,6 +394,8 @@ Directly view and modify .mph parameters.
         dialog = tk.Toplevel(self.root)
         dialog.title("Help")
         dialog.geometry("500x500")
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
+        self._help_dialog = dialog
 
         text = scrolledtext.ScrolledText(
             dialog,
@@ -276,7 +409,7 @@ Directly view and modify .mph parameters.
         tk.Button(
             dialog,
             text="Close",
-            command=dialog.destroy,
+            command=dialog.withdraw,
             bg="#3498db",
             fg="white",
             relief=tk.FLAT,
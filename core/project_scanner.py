@@ -1,14 +1,33 @@
 """
 Project scanning and analysis functionality
 """
+import json
+import os
+import sys
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+from datetime import date, datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Iterator, List, Optional, Any
+
+
+CACHE_FILENAME = ".scan_cache.json"
+
+# (unit, divisor) indexed by (bit_length - 1) // 10
+_SIZE_UNITS = (("B", 1), ("KB", 1024), ("MB", 1024 * 1024))
+
+
+@lru_cache(maxsize=1024)
+def _format_day(day_ordinal: int) -> str:
+    """Format a (local) calendar day; cached since many files share a day"""
+    return date.fromordinal(day_ordinal).strftime("%b %d, %Y")
 
 
 class ProjectScanner:
     """
     Scans directories for Comsol .mph files and extracts metadata.
+    Results are cached on disk keyed by (size, mtime) so unchanged files
+    are not re-analyzed on refresh.
     """
 
     def __init__(self, projects_path: Path):
@@ -19,6 +38,11 @@ class ProjectScanner:
             projects_path: Path to directory containing .mph files
         """
         self.projects_path = projects_path
+        # Fixed extension filter, compared against os.path.normcase(name)
+        # so it is case-insensitive on Windows like the filesystem
+        self._suffix = os.path.normcase(".mph")
+        self.cache_path = projects_path / CACHE_FILENAME
+        self._cache = self._load_cache()
 
     def scan_projects(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -28,56 +52,194 @@ class ProjectScanner:
             Dictionary mapping project names to project metadata
         """
         projects = {}
+        new_cache = {}
 
         if not self.projects_path.exists():
             return projects
 
-        # Find all .mph files recursively
-        mph_files = list(self.projects_path.rglob("*.mph"))
+        # Find all .mph files recursively (DirEntry carries the stat data)
+        root = str(self.projects_path)
+        prefix_len = len(os.path.join(root, ""))
+        mph_entries = sorted(self._iter_mph_entries(root), key=attrgetter('path'))
+
+        for entry in mph_entries:
+            try:
+                stat_info = entry.stat()
+            except OSError:
+                continue
+
+            project_name = entry.path[prefix_len:]
+
+            # Reuse cached metadata when size and mtime are unchanged
+            cached = self._cache.get(project_name)
+            project_info = None
+            if cached and cached[0] == stat_info.st_size and cached[1] == stat_info.st_mtime:
+                try:
+                    project_info = self._info_from_cache(Path(entry.path), stat_info, cached[2])
+                except (OverflowError, OSError, ValueError):
+                    pass
+            if project_info is None:
+                project_info = self.analyze_project(Path(entry.path), stat_info)
 
-        for mph_file in sorted(mph_files):
-            project_info = self.analyze_project(mph_file)
             if project_info:
-                rel_path = mph_file.relative_to(self.projects_path)
-                project_name = str(rel_path)
                 projects[project_name] = project_info
+                new_cache[project_name] = [
+                    stat_info.st_size,
+                    stat_info.st_mtime,
+                    {
+                        'size_str': project_info['size_str'],
+                        'modified_str': project_info['modified_str']
+                    }
+                ]
+
+        # Entries for files that no longer exist are dropped here
+        self._cache = new_cache
+        self._save_cache()
 
         return projects
 
-    def analyze_project(self, mph_file: Path) -> Optional[Dict[str, Any]]:
+    def _load_cache(self) -> Dict[str, List[Any]]:
         """
-        Analyze a Comsol .mph file to extract metadata.
+        Load the on-disk scan cache.
+
+        Entries that do not have the expected shape (older format or edited
+        by hand) are dropped; their files are re-analyzed and the cache is
+        rewritten by the next scan.
+
+        Returns:
+            Dictionary mapping project names to [size, mtime, metadata]
+        """
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        return {
+            name: entry for name, entry in cache.items()
+            if self._valid_cache_entry(entry)
+        }
+
+    @staticmethod
+    def _valid_cache_entry(entry: Any) -> bool:
+        """Check that entry is [size, mtime, {'size_str', 'modified_str'}]"""
+        if not (isinstance(entry, list) and len(entry) == 3):
+            return False
+        size, mtime, meta = entry
+        return (
+            isinstance(size, int) and not isinstance(size, bool)
+            and isinstance(mtime, (int, float)) and not isinstance(mtime, bool)
+            and isinstance(meta, dict)
+            and isinstance(meta.get('size_str'), str)
+            and isinstance(meta.get('modified_str'), str)
+        )
+
+    def _save_cache(self):
+        """Atomically write the scan cache next to the projects"""
+        tmp_path = self.cache_path.with_name(CACHE_FILENAME + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            # Cache is an optimization only - read-only folders still work
+            pass
+
+    @staticmethod
+    def _info_from_cache(
+        mph_file: Path,
+        stat_info: os.stat_result,
+        cached_meta: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """
+        Rebuild project metadata from a cache entry.
 
         Args:
             mph_file: Path to .mph file
+            stat_info: Stat result from the directory walk
+            cached_meta: Cached display strings
 
         Returns:
-            Dictionary with project metadata or None if analysis fails
+            Dictionary with project metadata
         """
-        try:
-            stat_info = mph_file.stat()
+        return {
+            'file_path': mph_file,
+            'file_name': mph_file.name,
+            'display_name': mph_file.stem,
+            'size_bytes': stat_info.st_size,
+            # Many files share a size/day string; intern the JSON copies
+            'size_str': sys.intern(cached_meta['size_str']),
+            'modified': datetime.fromtimestamp(stat_info.st_mtime),
+            'modified_str': sys.intern(cached_meta['modified_str'])
+        }
+
+    def _iter_mph_entries(self, root: str) -> Iterator[os.DirEntry]:
+        """
+        Yield directory entries for .mph files below root.
+
+        Uses an explicit stack instead of nested generators, and the cached
+        DirEntry type so no extra stat call is made per entry.
+
+        Args:
+            root: Directory to walk
+
+        Yields:
+            os.DirEntry for each .mph file found
+        """
+        suffix = self._suffix
+        normcase = os.path.normcase
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif normcase(entry.name).endswith(suffix) and entry.is_file():
+                            yield entry
+            except OSError:
+                # Unreadable directory - skip it
+                continue
 
-            # Calculate human-readable size
-            size_bytes = stat_info.st_size
-            size_str = self._format_file_size(size_bytes)
+    def analyze_project(
+        self,
+        mph_file: Path,
+        stat_info: os.stat_result
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Analyze a Comsol .mph file to extract metadata.
+
+        Args:
+            mph_file: Path to .mph file
+            stat_info: Stat result from the directory walk (no second stat call)
 
-            # Format modification time
+        Returns:
+            Dictionary with project metadata or None if the timestamp is invalid
+        """
+        # Calculate human-readable size
+        size_bytes = stat_info.st_size
+        size_str = self._format_file_size(size_bytes)
+
+        # Format modification time
+        try:
             mod_time = datetime.fromtimestamp(stat_info.st_mtime)
-            modified_str = mod_time.strftime("%b %d, %Y")
-
-            return {
-                'file_path': mph_file,
-                'display_name': mph_file.stem,
-                'size_bytes': size_bytes,
-                'size_str': size_str,
-                'modified': mod_time,
-                'modified_str': modified_str,
-                'folder': mph_file.parent
-            }
-        except Exception:
+        except (OverflowError, OSError, ValueError):
             return None
+        modified_str = _format_day(mod_time.toordinal())
+
+        return {
+            'file_path': mph_file,
+            'file_name': mph_file.name,
+            'display_name': mph_file.stem,
+            'size_bytes': size_bytes,
+            'size_str': size_str,
+            'modified': mod_time,
+            'modified_str': modified_str
+        }
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _format_file_size(size_bytes: int) -> str:
         """
         Format file size in human-readable format.
@@ -88,9 +250,8 @@ class ProjectScanner:
         Returns:
             Formatted string (e.g., "1.5 MB", "250 KB")
         """
-        if size_bytes < 1024:
+        idx = min((size_bytes.bit_length() - 1) // 10, 2) if size_bytes > 0 else 0
+        if idx == 0:
             return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        else:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
+        unit, divisor = _SIZE_UNITS[idx]
+        return f"{size_bytes / divisor:.1f} {unit}"
@@ -7,6 +7,8 @@ graceful error handling with helpful installation instructions.
 import sys
 import subprocess
 import shutil
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Tuple, Optional, List
 
@@ -34,33 +36,24 @@ class DependencyChecker:
     
     def check_uv_installed(self) -> bool:
         """Check if UV package manager is installed."""
-        # Check if 'uv' command is available
-        if shutil.which('uv'):
-            try:
-                result = subprocess.run(
-                    ['uv', '--version'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    self.has_uv = True
-                    return True
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
-        
-        # Check if UV can be imported as module
+        # Prefer the 'uv' command; only probe 'python -m uv' when it is not on PATH
+        uv_path = shutil.which('uv')
+        if uv_path:
+            cmd = [uv_path, '--version']
+        else:
+            cmd = [sys.executable, '-m', 'uv', '--version']
+
         try:
-            subprocess.run(
-                [sys.executable, '-m', 'uv', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                check=True
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5
             )
-            self.has_uv = True
-            return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+            if result.returncode == 0:
+                self.has_uv = True
+                return True
+        except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
         
         self.warnings.append(
@@ -70,11 +63,10 @@ class DependencyChecker:
         return False
     
     def check_package_installed(self, package_name: str) -> bool:
-        """Check if a Python package is installed."""
+        """Check if a Python package is installed (without importing it)."""
         try:
-            __import__(package_name)
-            return True
-        except ImportError:
+            return importlib.util.find_spec(package_name) is not None
+        except (ImportError, ValueError):
             return False
     
     def check_mph(self) -> bool:
@@ -125,8 +117,8 @@ class DependencyChecker:
             try:
                 result = subprocess.run(
                     ['java', '-version'],
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     timeout=5
                 )
                 if result.returncode == 0:
@@ -171,10 +163,13 @@ class DependencyChecker:
         mph_ok = self.check_mph()
         numpy_ok = self.check_numpy()
         
-        # Optional/informational checks
-        self.check_uv_installed()
-        self.check_java_available()
-        self.check_projects_folder()
+        # Optional/informational checks - subprocess probes run concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            wait([
+                executor.submit(self.check_uv_installed),
+                executor.submit(self.check_java_available),
+                executor.submit(self.check_projects_folder)
+            ])
         
         # Check COMSOL if requested
         if check_comsol and mph_ok:
@@ -244,10 +239,10 @@ class DependencyChecker:
             else:
                 cmd = [sys.executable, '-m', 'pip', 'install'] + missing
             
+            # Output streams straight to the console (not buffered in Python)
             result = subprocess.run(
                 cmd,
                 check=True,
-                text=True,
                 timeout=300  # 5 minute timeout
             )
             
@@ -1,10 +1,17 @@
 """
 Feature modules for Comsol Project Manager
+
+Feature classes are imported lazily on first attribute access (PEP 562),
+so a feature module is only loaded once it is actually used.
 """
-from .quick_run import QuickRunFeature
-from .launcher_generator import LauncherGenerator
-from .advanced_mode import AdvancedModeFeature
-from .inspect_mode import InspectModeFeature
+import importlib
+
+_LAZY = {
+    'QuickRunFeature': 'quick_run',
+    'LauncherGenerator': 'launcher_generator',
+    'AdvancedModeFeature': 'advanced_mode',
+    'InspectModeFeature': 'inspect_mode'
+}
 
 __all__ = [
     'QuickRunFeature',
@@ -12,3 +19,16 @@ __all__ = [
     'AdvancedModeFeature',
     'InspectModeFeature'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(f'.{_LAZY[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
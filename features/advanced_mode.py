@@ -3,10 +3,27 @@ Advanced Mode feature - Connect to Comsol, edit parameters, run simulations
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import threading
+import importlib
+import os
+import queue
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Dict, Optional
 
+from ui.fonts import shared_font
+from ui.tree_utils import insert_rows
+from utils import mph_client
+
+
+def _prewarm_mph():
+    """Import mph in the background so Connect finds it already loaded"""
+    try:
+        importlib.import_module('mph')
+    except ImportError:
+        pass  # Reported when the user connects
+
 
 class AdvancedModeFeature:
     """
@@ -28,17 +45,30 @@ class AdvancedModeFeature:
         self.current_model = None
         self.params_tree = None
         self.window = None
+        self._result_q = queue.Queue()
+
+        # One worker serializes every Comsol call on this model
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="comsol-advanced")
+        if 'mph' not in sys.modules:
+            self._pool.submit(_prewarm_mph)
 
     def show(self):
         """Display the advanced mode window"""
         self.window = tk.Toplevel(self.root)
+        self.window.withdraw()  # Map once, after the widget tree is built
         self.window.title(f"Advanced Mode - {self.project_info['display_name']}")
         self.window.geometry("750x550")
 
+        # Worker threads post results to _result_q and signal with a virtual event
+        self.window.bind('<<CommandDone>>', self._on_command_done)
+        self.window.protocol("WM_DELETE_WINDOW", self._close)
+
         self._create_title_bar()
         self._create_parameters_tree()
         self._create_bottom_buttons()
 
+        self.window.deiconify()
+
     def _create_title_bar(self):
         """Create colored title bar"""
         title_bar = tk.Frame(self.window, bg="#34495e", height=60)
@@ -48,7 +78,7 @@ class AdvancedModeFeature:
         tk.Label(
             title_bar,
             text=f"⚙️  {self.project_info['display_name']}",
-            font=("Arial", 14, "bold"),
+            font=shared_font("Arial", 14, "bold"),
             bg="#34495e",
             fg="white"
         ).pack(pady=15)
@@ -61,7 +91,7 @@ class AdvancedModeFeature:
         tk.Label(
             params_frame,
             text="Model Parameters (Double-click to edit)",
-            font=("Arial", 10, "bold")
+            font=shared_font("Arial", 10, "bold")
         ).pack(anchor=tk.W, pady=(0, 5))
 
         params_columns = ('parameter', 'value', 'status')
@@ -109,7 +139,7 @@ class AdvancedModeFeature:
             command=self._connect_to_comsol,
             bg="#3498db",
             fg="white",
-            font=("Arial", 10),
+            font=shared_font("Arial", 10),
             relief=tk.FLAT,
             padx=15,
             pady=8
@@ -124,7 +154,7 @@ class AdvancedModeFeature:
             state=tk.DISABLED,
             bg="#16a085",
             fg="white",
-            font=("Arial", 10),
+            font=shared_font("Arial", 10),
             relief=tk.FLAT,
             padx=15,
             pady=8
@@ -139,7 +169,7 @@ class AdvancedModeFeature:
             state=tk.DISABLED,
             bg="#27ae60",
             fg="white",
-            font=("Arial", 10),
+            font=shared_font("Arial", 10),
             relief=tk.FLAT,
             padx=15,
             pady=8
@@ -154,7 +184,7 @@ class AdvancedModeFeature:
             state=tk.DISABLED,
             bg="#8e44ad",
             fg="white",
-            font=("Arial", 10),
+            font=shared_font("Arial", 10),
             relief=tk.FLAT,
             padx=15,
             pady=8
@@ -165,10 +195,10 @@ class AdvancedModeFeature:
         tk.Button(
             btn_inner,
             text="Close",
-            command=self.window.destroy,
+            command=self._close,
             bg="#95a5a6",
             fg="white",
-            font=("Arial", 10),
+            font=shared_font("Arial", 10),
             relief=tk.FLAT,
             padx=15,
             pady=8
@@ -176,22 +206,10 @@ class AdvancedModeFeature:
 
     def _connect_to_comsol(self):
         """Connect to Comsol server"""
-        def connect_thread():
-            try:
-                import mph
-                self.mph_client = mph.start()
-                self.root.after(0, lambda: self.load_btn.config(state=tk.NORMAL))
-                self.root.after(0, lambda: messagebox.showinfo(
-                    "Connected",
-                    "Connected to Comsol server"
-                ))
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror(
-                    "Error",
-                    f"Connection failed:\n{str(e)}"
-                ))
-
-        threading.Thread(target=connect_thread, daemon=True).start()
+        def connect_task():
+            self.mph_client = mph_client.get_client()
+
+        self._submit(connect_task, 'connected', "Connection failed:\n")
 
     def _load_parameters(self):
         """Load model and parameters from Comsol"""
@@ -199,26 +217,17 @@ class AdvancedModeFeature:
             messagebox.showwarning("Not Connected", "Connect to Comsol first")
             return
 
-        def load_thread():
-            try:
-                # Load model
-                self.current_model = self.mph_client.load(
-                    str(self.project_info['file_path'])
-                )
-
-                # Get parameters
-                params = self.current_model.parameters()
+        def load_task():
+            # Load model, unloading the one from a previous Load
+            self._release_model()
+            self.current_model = self.mph_client.load(
+                os.fspath(self.project_info['file_path'])
+            )
 
-                # Update UI
-                self.root.after(0, lambda: self._display_parameters(params))
-                self.root.after(0, lambda: self.run_btn.config(state=tk.NORMAL))
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror(
-                    "Error",
-                    f"Load failed:\n{str(e)}"
-                ))
+            # Get parameters
+            return self.current_model.parameters()
 
-        threading.Thread(target=load_thread, daemon=True).start()
+        self._submit(load_task, 'loaded', "Load failed:\n")
 
     def _display_parameters(self, params: Dict[str, str]):
         """
@@ -227,13 +236,16 @@ class AdvancedModeFeature:
         Args:
             params: Dictionary of parameter names to values
         """
-        # Clear existing items
-        for item in self.params_tree.get_children():
-            self.params_tree.delete(item)
+        # Clear existing items (one delete call for all rows)
+        children = self.params_tree.get_children()
+        if children:
+            self.params_tree.delete(*children)
 
-        # Add parameters
-        for param_name, param_value in params.items():
-            self.params_tree.insert('', 'end', values=(param_name, param_value, ""))
+        # Add parameters (one Tcl call for all rows)
+        insert_rows(self.params_tree, [
+            ('', (param_name, param_value, ""), ())
+            for param_name, param_value in params.items()
+        ])
 
     def _edit_parameter(self):
         """Open dialog to edit selected parameter"""
@@ -258,7 +270,7 @@ class AdvancedModeFeature:
         tk.Label(
             dialog,
             text=param_name,
-            font=("Arial", 10, "bold")
+            font=shared_font("Arial", 10, "bold")
         ).pack(pady=10)
 
         tk.Label(
@@ -274,15 +286,14 @@ class AdvancedModeFeature:
         def save():
             new_value = entry.get().strip()
             if new_value:
-                try:
+                dialog.destroy()
+
+                # On the worker, after any build/solve already queued
+                def update_task():
                     self.current_model.parameter(param_name, new_value)
-                    self.params_tree.item(
-                        item,
-                        values=(param_name, new_value, "✓ Updated")
-                    )
-                    dialog.destroy()
-                except Exception as e:
-                    messagebox.showerror("Error", str(e))
+                    return item, param_name, new_value
+
+                self._submit(update_task, 'updated', "Update failed:\n")
 
         tk.Button(
             dialog,
@@ -311,22 +322,100 @@ class AdvancedModeFeature:
         if not self.current_model:
             return
 
-        def run_thread():
+        def run_task():
+            self.current_model.build()
+            self.current_model.solve()
+
+        self._submit(run_task, 'solved')
+
+    def _submit(self, task, kind: str, error_prefix: str = ""):
+        """
+        Run task on the worker and post its outcome when it finishes.
+
+        Args:
+            task: Callable run on the worker thread
+            kind: Result kind posted on success, with the task's return value
+            error_prefix: Text placed before the exception message on failure
+        """
+        future = self._pool.submit(task)
+        future.add_done_callback(partial(self._on_task_done, kind, error_prefix))
+
+    def _on_task_done(self, kind: str, error_prefix: str, future):
+        """Post a finished task's result or error (worker thread)"""
+        error = future.exception()
+        if error is not None:
+            self._post('error', f"{error_prefix}{str(error)}")
+        else:
+            self._post(kind, future.result())
+
+    def _release_model(self):
+        """
+        Unload the current model from the shared client (worker thread).
+
+        The client lives for the whole session, so models left loaded
+        would keep their memory in its JVM until the app exits.
+        """
+        model, self.current_model = self.current_model, None
+        if model is not None and self.mph_client is not None:
             try:
-                self.current_model.build()
-                self.current_model.solve()
-                self.root.after(0, lambda: messagebox.showinfo(
-                    "Success",
-                    "Simulation complete!"
-                ))
-                self.root.after(0, lambda: self.export_btn.config(state=tk.NORMAL))
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror(
-                    "Error",
-                    str(e)
-                ))
-
-        threading.Thread(target=run_thread, daemon=True).start()
+                self.mph_client.remove(model)
+            except Exception:
+                pass  # Already gone, or the server went away
+
+    def _close(self):
+        """Close the window and let the worker finish without new tasks"""
+        # Queued behind any running build/solve, so the model is not
+        # removed from under it
+        self._pool.submit(self._release_model)
+        self._pool.shutdown(wait=False)
+        self.window.destroy()
+
+    def _post(self, kind: str, payload=None):
+        """
+        Queue a worker result and wake the Tk thread (worker thread).
+
+        Args:
+            kind: 'connected', 'loaded', 'updated', 'solved', 'saved' or 'error'
+            payload: Parameters for 'loaded', (item, name, value) for
+                'updated', path for 'saved', message for 'error'
+        """
+        self._result_q.put((kind, payload))
+        try:
+            self.window.event_generate('<<CommandDone>>', when='tail')
+        except tk.TclError:
+            pass  # Window was closed
+
+    def _on_command_done(self, event=None):
+        """Apply queued worker results (Tk thread)"""
+        while True:
+            try:
+                kind, payload = self._result_q.get_nowait()
+            except queue.Empty:
+                return
+
+            if kind == 'connected':
+                self.load_btn.config(state=tk.NORMAL)
+                messagebox.showinfo("Connected", "Connected to Comsol server")
+            elif kind == 'loaded':
+                self._display_parameters(payload)
+                self.run_btn.config(state=tk.NORMAL)
+            elif kind == 'updated':
+                item, param_name, new_value = payload
+                if self.params_tree.exists(item):
+                    self.params_tree.item(
+                        item,
+                        values=(param_name, new_value, "✓ Updated")
+                    )
+            elif kind == 'solved':
+                messagebox.showinfo("Success", "Simulation complete!")
+                self.export_btn.config(state=tk.NORMAL)
+            elif kind == 'saved':
+                messagebox.showinfo(
+                    "Saved",
+                    f"Model saved to:\n{payload}"
+                )
+            else:
+                messagebox.showerror("Error", payload)
 
     def _export_results(self):
         """Export simulation results to file"""
@@ -340,11 +429,10 @@ class AdvancedModeFeature:
         )
 
         if save_path:
-            try:
+            # Saving can take a while; keep it off the Tk thread and in
+            # order with the other Comsol calls
+            def save_task():
                 self.current_model.save(save_path)
-                messagebox.showinfo(
-                    "Saved",
-                    f"Model saved to:\n{save_path}"
-                )
-            except Exception as e:
-                messagebox.showerror("Error", str(e))
+                return save_path
+
+            self._submit(save_task, 'saved', "Save failed:\n")
@@ -3,12 +3,21 @@ Inspect & Edit mode - View and modify .mph files without Comsol
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
+import queue
+import threading
+import zipfile
 from pathlib import Path
 from typing import Dict
 
+from ui.fonts import shared_font
 from ui.tooltip import ToolTip
+from ui.tree_utils import LazyRows
 from utils.mph_parser import MphParser
 from utils.mph_saver import MphSaver
+from .inspect_mode_editor import ParameterEditor
+
+# Files handed from the parser thread to the tree per batch
+FILE_BATCH_SIZE = 50
 
 
 class InspectModeFeature:
@@ -30,11 +39,15 @@ class InspectModeFeature:
         self.mph_path = project_info['file_path']
         self.param_tree = None
         self.modified_params = set()
+        self._tabs = {}
+        self._loaded_tabs = set()
+        self._saving = False
 
     def show(self):
         """Display the inspect & edit window"""
         # Create inspect window
         inspect_window = tk.Toplevel(self.root)
+        inspect_window.withdraw()  # Map once, after the widget tree is built
         inspect_window.title(f"Inspect & Edit - {self.project_info['display_name']}")
         inspect_window.geometry("900x700")
 
@@ -46,14 +59,18 @@ class InspectModeFeature:
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Create tabs
-        file_tree, param_tree, info_text = self._create_tabs(notebook)
-        self.param_tree = param_tree
+        self._create_tabs(notebook)
 
         # Bottom buttons
         self._create_bottom_buttons(inspect_window)
 
-        # Load data
-        self._load_content(file_tree, param_tree, info_text)
+        # Load data - each tab is parsed the first time it is shown,
+        # starting with Parameters
+        notebook.bind('<<NotebookTabChanged>>', lambda e: self._on_tab_changed(notebook))
+        notebook.select(1)
+        self._on_tab_changed(notebook)
+
+        inspect_window.deiconify()
 
     def _create_title_bar(self, window):
         """Create colored title bar"""
@@ -64,29 +81,30 @@ class InspectModeFeature:
         tk.Label(
             title_bar,
             text=f"🔍  {self.project_info['display_name']}.mph",
-            font=("Arial", 14, "bold"),
+            font=shared_font("Arial", 14, "bold"),
             bg="#d35400",
             fg="white"
         ).pack(pady=15)
 
     def _create_tabs(self, notebook):
-        """Create the three tabs and return their widgets"""
+        """Create the three tabs, keyed by frame name in self._tabs"""
         # Tab 1: File Structure
         contents_frame = ttk.Frame(notebook)
         notebook.add(contents_frame, text="📁 File Structure")
         file_tree = self._create_file_structure_tab(contents_frame)
+        self._tabs[str(contents_frame)] = ('files', file_tree)
 
         # Tab 2: Parameters
         params_frame = ttk.Frame(notebook)
         notebook.add(params_frame, text="⚙️ Parameters")
-        param_tree = self._create_parameters_tab(params_frame)
+        self.param_tree = self._create_parameters_tab(params_frame)
+        self._tabs[str(params_frame)] = ('params', self.param_tree)
 
         # Tab 3: Model Info
         info_frame = ttk.Frame(notebook)
         notebook.add(info_frame, text="ℹ️ Model Info")
         info_text = self._create_model_info_tab(info_frame)
-
-        return file_tree, param_tree, info_text
+        self._tabs[str(info_frame)] = ('info', info_text)
 
     def _create_file_structure_tab(self, parent):
         """Create file structure tab with color-coded tree"""
@@ -96,7 +114,7 @@ class InspectModeFeature:
         tk.Label(
             header_frame,
             text="Internal file structure:",
-            font=("Arial", 10, "bold")
+            font=shared_font("Arial", 10, "bold")
         ).pack(side=tk.LEFT)
 
         # Color legend
@@ -123,7 +141,7 @@ class InspectModeFeature:
         file_tree.tag_configure('archive', foreground='#e67e22')
 
         tree_scroll = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=file_tree.yview)
-        file_tree.configure(yscrollcommand=tree_scroll.set)
+        self._file_rows = LazyRows(file_tree, tree_scroll)
 
         file_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
@@ -131,20 +149,21 @@ class InspectModeFeature:
         return file_tree
 
     def _create_color_legend(self, parent):
-        """Create color legend for file types"""
+        """Create color legend for file types, drawn on a single canvas"""
         legend_frame = tk.Frame(parent, bg="#f8f9fa", bd=1, relief=tk.SOLID)
         legend_frame.pack(fill=tk.X, padx=10, pady=(0, 5))
 
-        legend_inner = tk.Frame(legend_frame, bg="#f8f9fa")
-        legend_inner.pack(pady=5)
+        title_font = shared_font("Arial", 8, "bold")
+        dot_font = shared_font("Arial", 10)
+        label_font = shared_font("Arial", 8)
 
-        tk.Label(
-            legend_inner,
-            text="Legend:",
-            font=("Arial", 8, "bold"),
-            bg="#f8f9fa",
-            fg="#34495e"
-        ).pack(side=tk.LEFT, padx=5)
+        height = dot_font.metrics('linespace')
+        legend = tk.Canvas(legend_frame, bg="#f8f9fa", height=height, highlightthickness=0)
+        y = height // 2
+
+        x = 5
+        legend.create_text(x, y, text="Legend:", font=title_font, fill="#34495e", anchor=tk.W)
+        x += title_font.measure("Legend:") + 5
 
         colors = [
             ("#2980b9", "Config"),
@@ -156,27 +175,21 @@ class InspectModeFeature:
         ]
 
         for color, label in colors:
-            tk.Label(
-                legend_inner,
-                text="●",
-                fg=color,
-                bg="#f8f9fa",
-                font=("Arial", 10)
-            ).pack(side=tk.LEFT, padx=(8, 0))
-            tk.Label(
-                legend_inner,
-                text=label,
-                font=("Arial", 8),
-                bg="#f8f9fa",
-                fg="#34495e"
-            ).pack(side=tk.LEFT, padx=(0, 5))
+            x += 8
+            legend.create_text(x, y, text="●", font=dot_font, fill=color, anchor=tk.W)
+            x += dot_font.measure("●")
+            legend.create_text(x, y, text=label, font=label_font, fill="#34495e", anchor=tk.W)
+            x += label_font.measure(label) + 5
+
+        legend.config(width=x)
+        legend.pack(pady=5)
 
     def _create_parameters_tab(self, parent):
         """Create parameters tab with editable tree"""
         tk.Label(
             parent,
             text="Model Parameters (editable):",
-            font=("Arial", 10, "bold")
+            font=shared_font("Arial", 10, "bold")
         ).pack(anchor=tk.W, padx=10, pady=5)
 
         # Parameters tree
@@ -200,7 +213,7 @@ class InspectModeFeature:
         param_tree.tag_configure('modified', background='#fff9e6', foreground='#e67e22')
 
         param_scroll = ttk.Scrollbar(param_tree_frame, orient=tk.VERTICAL, command=param_tree.yview)
-        param_tree.configure(yscrollcommand=param_scroll.set)
+        self._param_rows = LazyRows(param_tree, param_scroll)
 
         param_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         param_scroll.pack(side=tk.RIGHT, fill=tk.Y)
@@ -215,7 +228,7 @@ class InspectModeFeature:
         tk.Label(
             help_frame,
             text="💡 Double-click any parameter to edit  •  Modified parameters are highlighted in orange",
-            font=("Arial", 9),
+            font=shared_font("Arial", 9),
             fg="#34495e",
             bg="#ecf0f1",
             anchor=tk.W
@@ -225,7 +238,7 @@ class InspectModeFeature:
 
     def _create_model_info_tab(self, parent):
         """Create model info tab with statistics"""
-        info_text = scrolledtext.ScrolledText(parent, wrap=tk.WORD, font=("Courier", 9))
+        info_text = scrolledtext.ScrolledText(parent, wrap=tk.WORD, font=shared_font("Courier", 9))
         info_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         return info_text
 
@@ -244,7 +257,7 @@ class InspectModeFeature:
             command=self._save_changes,
             bg="#27ae60",
             fg="white",
-            font=("Arial", 10),
+            font=shared_font("Arial", 10),
             relief=tk.FLAT,
             padx=20,
             pady=8,
@@ -258,7 +271,7 @@ class InspectModeFeature:
             command=self._export_files,
             bg="#3498db",
             fg="white",
-            font=("Arial", 10),
+            font=shared_font("Arial", 10),
             relief=tk.FLAT,
             padx=20,
             pady=8,
@@ -272,7 +285,7 @@ class InspectModeFeature:
             command=window.destroy,
             bg="#95a5a6",
             fg="white",
-            font=("Arial", 10),
+            font=shared_font("Arial", 10),
             relief=tk.FLAT,
             padx=20,
             pady=8,
@@ -285,78 +298,187 @@ class InspectModeFeature:
         ToolTip(export_btn, "Extract all files to a folder for inspection")
         ToolTip(close_btn, "Close inspector (changes not saved)")
 
-    def _load_content(self, file_tree, param_tree, info_text):
-        """Load all content into the tabs"""
-        # Load file list
-        files = MphParser.load_file_list(self.mph_path)
-        for file_info in files:
-            file_tree.insert(
-                '',
-                'end',
-                text=file_info['filename'],
-                values=(file_info['size'], file_info['type']),
-                tags=(file_info['tag'],)
-            )
+    def _on_tab_changed(self, notebook):
+        """Load the selected tab's content the first time it is shown"""
+        kind, widget = self._tabs[notebook.select()]
+        if kind not in self._loaded_tabs:
+            self._loaded_tabs.add(kind)
+            self._load_content(kind, widget)
+
+    def _load_content(self, kind, widget):
+        """
+        Parse one tab's content in a worker thread and fill it when ready.
+
+        Args:
+            kind: 'files', 'params' or 'info'
+            widget: Tree or text widget to fill
+        """
+        results = queue.Queue()
+        threading.Thread(target=self._parse_worker, args=(kind, results), daemon=True).start()
+        self.root.after(50, self._drain_queue, kind, widget, results)
 
-        # Load parameters
-        parameters = MphParser.load_parameters_from_mph(self.mph_path)
-        for name, value, desc in parameters:
-            param_tree.insert('', 'end', values=(name, value, desc), tags=(name,))
+    def _parse_worker(self, kind, results):
+        """
+        Parse the .mph file (worker thread - no Tk calls).
 
-        # Load model info
-        model_info = MphParser.load_model_info(self.mph_path)
+        Args:
+            kind: 'files', 'params' or 'info'
+            results: Queue receiving parsed content, then None when finished
+        """
+        try:
+            if kind == 'files':
+                # Hand over the file list in batches so the tree fills progressively
+                with MphParser.open(self.mph_path) as archive:
+                    batch = []
+                    for file_info in archive.iter_file_list():
+                        batch.append(file_info)
+                        if len(batch) == FILE_BATCH_SIZE:
+                            results.put(batch)
+                            batch = []
+                    if batch:
+                        results.put(batch)
+            elif kind == 'params':
+                # Parameters and model info are cached per file and mtime
+                results.put(MphParser.load_parameters_from_mph(self.mph_path))
+            else:
+                model_info = MphParser.load_model_info(self.mph_path)
+                if model_info:
+                    model_info['file_size'] = self.mph_path.stat().st_size
+                    results.put(model_info)
+        except (OSError, zipfile.BadZipFile):
+            pass  # Unreadable archive - tab stays empty
+        finally:
+            results.put(None)
+
+    def _drain_queue(self, kind, widget, results):
+        """Fill the tab as its content is parsed (Tk thread)"""
+        if not widget.winfo_exists():
+            return  # Window was closed
+
+        while True:
+            try:
+                payload = results.get_nowait()
+            except queue.Empty:
+                self.root.after(50, self._drain_queue, kind, widget, results)
+                return
+
+            if payload is None:
+                return
+            if kind == 'files':
+                self._show_files(widget, payload)
+            elif kind == 'params':
+                self._show_parameters(widget, payload)
+            else:
+                self._show_model_info(widget, payload)
+
+    def _show_files(self, file_tree, files):
+        """Append a batch of files to the file structure tree"""
+        self._file_rows.add_rows([
+            (
+                file_info['filename'],
+                (file_info['size'], file_info['type']),
+                (file_info['tag'],)
+            )
+            for file_info in files
+        ])
+
+    def _show_parameters(self, param_tree, parameters):
+        """Fill the parameters tree"""
+        self._param_rows.set_rows([
+            ('', (name, value, desc), (name,))
+            for name, value, desc in parameters
+        ])
+
+    def _show_model_info(self, info_text, model_info):
+        """Fill the model info text"""
         if model_info:
-            info_text.insert(tk.END, "=== FILE INFORMATION ===\n\n")
-            info_text.insert(tk.END, f"File: {self.mph_path.name}\n")
-            info_text.insert(tk.END, f"Size: {self.mph_path.stat().st_size / 1024 / 1024:.2f} MB\n")
-            info_text.insert(tk.END, f"Comsol Version: {model_info['version']}\n")
-            info_text.insert(tk.END, f"Internal files: {model_info['file_count']}\n\n")
-            info_text.insert(tk.END, f"Title: {model_info['title']}\n")
-            info_text.insert(tk.END, f"Description: {model_info['description']}\n")
-            info_text.insert(tk.END, "\n=== STORAGE BREAKDOWN ===\n\n")
-            info_text.insert(tk.END, f"Total data size: {model_info['total_size_mb']:.2f} MB\n")
-            info_text.insert(tk.END, f"Configuration (XML/JSON): {model_info['text_size_mb']:.2f} MB ({model_info['text_percent']:.1f}%)\n")
-            info_text.insert(tk.END, f"Simulation data (binary): {model_info['binary_size_mb']:.2f} MB ({model_info['binary_percent']:.1f}%)\n")
+            info_text.insert(tk.END, "".join((
+                "=== FILE INFORMATION ===\n\n",
+                f"File: {self.mph_path.name}\n",
+                f"Size: {model_info['file_size'] / 1024 / 1024:.2f} MB\n",
+                f"Comsol Version: {model_info['version']}\n",
+                f"Internal files: {model_info['file_count']}\n\n",
+                f"Title: {model_info['title']}\n",
+                f"Description: {model_info['description']}\n",
+                "\n=== STORAGE BREAKDOWN ===\n\n",
+                f"Total data size: {model_info['total_size_mb']:.2f} MB\n",
+                f"Configuration (XML/JSON): {model_info['text_size_mb']:.2f} MB ({model_info['text_percent']:.1f}%)\n",
+                f"Simulation data (binary): {model_info['binary_size_mb']:.2f} MB ({model_info['binary_percent']:.1f}%)\n"
+            )))
             info_text.config(state=tk.DISABLED)
 
     def _edit_parameter(self):
         """Open parameter edit dialog"""
-        from .inspect_mode_editor import ParameterEditor
         ParameterEditor(self.root, self.param_tree, self.mph_path).show()
 
     def _save_changes(self):
         """Save modified parameters to new .mph file"""
-        # Collect all parameters
+        if self._saving:
+            return  # A save is already running
+
+        # Collect all parameters; item() without an option converts
+        # numeric-looking values ('007' -> 7), so read the raw values
         params = {}
         modified_count = 0
-        for item in self.param_tree.get_children():
-            values = self.param_tree.item(item, 'values')
-            tags = self.param_tree.item(item, 'tags')
+        tree = self.param_tree
+        for item in tree.get_children():
+            values = tree.item(item, 'values')
             if len(values) >= 2:
-                params[values[0]] = values[1]
-                if 'modified' in tags:
+                params[str(values[0])] = str(values[1])
+                if tree.tag_has('modified', item):
                     modified_count += 1
 
+        # Rows not yet scrolled into the tree are unmodified
+        for _, (name, value, _desc), _ in self._param_rows.pending():
+            params[name] = value
+
         if modified_count == 0:
             messagebox.showinfo("No Changes", "No parameters have been modified.")
             return
 
-        # Show progress
+        # Show progress and save in the background so the UI stays live
         progress = self._show_progress_dialog(modified_count)
+        self._saving = True
+
+        # The worker hands its result over through a queue and wakes the
+        # Tk thread with a virtual event
+        results = queue.Queue()
+        progress.bind(
+            '<<SaveComplete>>',
+            lambda e: self._finish_save(progress, results.get(), len(params), modified_count)
+        )
+
+        def save_thread():
+            results.put(MphSaver.save_modified_mph(self.mph_path, params))
+            try:
+                progress.event_generate('<<SaveComplete>>', when='tail')
+            except (tk.TclError, RuntimeError):
+                # The progress dialog is gone, so _finish_save will never
+                # run; unblock Save here instead
+                self._saving = False
+
+        threading.Thread(target=save_thread, daemon=True).start()
 
-        # Save
-        success, message, new_mph, backup = MphSaver.save_modified_mph(self.mph_path, params)
+    def _finish_save(self, progress, result, param_count, modified_count):
+        """Report the save result (Tk thread)"""
+        success, message, new_mph, backup = result
 
+        self._saving = False
         progress.destroy()
 
-        if success:
+        if success and backup is None:
+            messagebox.showinfo(
+                "No Changes",
+                "The edited values match the file; nothing was saved."
+            )
+        elif success:
             messagebox.showinfo(
                 "✓ Success",
                 f"Changes saved successfully!\n\n"
                 f"New file: {new_mph.name}\n"
                 f"Backup: {backup.name}\n\n"
                 f"Modified parameters: {modified_count}\n"
-                f"Total parameters: {len(params)}"
+                f"Total parameters: {param_count}"
             )
         else:
             messagebox.showerror("Error", f"Failed to save changes:\n\n{message}")
@@ -373,14 +495,14 @@ class InspectModeFeature:
         tk.Label(
             progress,
             text="💾 Saving parameter changes...",
-            font=("Arial", 11, "bold"),
+            font=shared_font("Arial", 11, "bold"),
             bg="white"
         ).pack(pady=(20, 5))
 
         tk.Label(
             progress,
             text=f"Processing {modified_count} modified parameter(s)",
-            font=("Arial", 9),
+            font=shared_font("Arial", 9),
             fg="#7f8c8d",
             bg="white"
         ).pack(pady=5)
@@ -389,7 +511,7 @@ class InspectModeFeature:
         progress_bar.pack(pady=10)
         progress_bar.start(10)
 
-        self.root.update()
+        progress.update_idletasks()
         return progress
 
     def _export_files(self):
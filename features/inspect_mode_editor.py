@@ -1,10 +1,30 @@
 """
 Parameter editor dialog for Inspect Mode
 """
+import re
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import ttk, messagebox
 from pathlib import Path
 
+from ui.fonts import shared_font
+from ui.styles import register_styles
+
+# Dialog colors
+WHITE = "white"
+HEADER_BG = "#e67e22"
+MUTED_FG = "#7f8c8d"
+ENTRY_BORDER = "#3498db"
+HELP_BG = "#ecf0f1"
+TEXT_FG = "#34495e"
+ERROR_COLOR = "#e74c3c"
+BUTTON_BAR_BG = "#f8f9fa"
+SUCCESS_COLOR = "#27ae60"
+NEUTRAL_COLOR = "#95a5a6"
+
+# A plain number with an optional unit, e.g. 10[W], 5.5[mm], 1e-3[m^2], 0.8.
+# Compiled once; ASCII skips Unicode classes on this per-keystroke check.
+_UNIT_RE = re.compile(r'-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?(?:\[[A-Za-z0-9/*^.\-]+\])?', re.ASCII)
+
 
 class ParameterEditor:
     """
@@ -23,6 +43,8 @@ class ParameterEditor:
         self.root = root
         self.param_tree = param_tree
         self.mph_path = mph_path
+        self.entry_var = None
+        self._pending_validation = None
 
     def show(self):
         """Show parameter edit dialog"""
@@ -42,7 +64,8 @@ class ParameterEditor:
         dialog.geometry("500x280")
         dialog.transient(self.root)
         dialog.grab_set()
-        dialog.configure(bg="white")
+        dialog.configure(bg=WHITE)
+        register_styles(self._styles())
 
         # Header
         self._create_header(dialog, param_name)
@@ -60,80 +83,95 @@ class ParameterEditor:
         # Setup validation
         self._setup_validation(entry, feedback_label, current_value)
 
+    @staticmethod
+    def _styles():
+        """Named ttk styles used by the dialog"""
+        return {
+            "EditorHeader.TLabel": dict(
+                background=HEADER_BG, foreground=WHITE, font=shared_font("Arial", 13, "bold")
+            ),
+            "EditorDescription.TLabel": dict(
+                background=WHITE, foreground=MUTED_FG, font=shared_font("Arial", 9)
+            ),
+            "EditorField.TLabel": dict(
+                background=WHITE, font=shared_font("Arial", 9, "bold")
+            ),
+            "EditorHelp.TLabel": dict(
+                background=HELP_BG, foreground=TEXT_FG, font=shared_font("Arial", 8)
+            ),
+            "EditorFeedback.TLabel": dict(
+                background=WHITE, foreground=ERROR_COLOR, font=shared_font("Arial", 8)
+            )
+        }
+
     def _create_header(self, dialog, param_name):
         """Create colored header"""
-        header = tk.Frame(dialog, bg="#e67e22", height=60)
+        header = tk.Frame(dialog, bg=HEADER_BG, height=60)
         header.pack(fill=tk.X)
         header.pack_propagate(False)
 
-        tk.Label(
+        ttk.Label(
             header,
             text=param_name,
-            font=("Arial", 13, "bold"),
-            bg="#e67e22",
-            fg="white"
+            style="EditorHeader.TLabel"
         ).pack(pady=18)
 
     def _create_content(self, dialog, description, current_value):
         """Create content area with entry field"""
-        content = tk.Frame(dialog, bg="white")
+        content = tk.Frame(dialog, bg=WHITE)
         content.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
 
         # Description
-        tk.Label(
+        ttk.Label(
             content,
             text=description,
-            font=("Arial", 9),
-            fg="#7f8c8d",
-            bg="white",
+            style="EditorDescription.TLabel",
             wraplength=450
         ).pack(pady=(0, 10))
 
         # Label
-        tk.Label(
+        ttk.Label(
             content,
             text="New Value:",
-            font=("Arial", 9, "bold"),
-            bg="white",
+            style="EditorField.TLabel",
             anchor=tk.W
         ).pack(fill=tk.X)
 
         # Entry with border
-        entry_frame = tk.Frame(content, bg="#3498db", bd=0)
+        entry_frame = tk.Frame(content, bg=ENTRY_BORDER, bd=0)
         entry_frame.pack(fill=tk.X, pady=5)
 
+        # Entry shows the variable's initial value; no separate insert needed.
+        # Kept on self: tkinter unsets the Tcl variable when it is collected.
+        self.entry_var = tk.StringVar(dialog, value=current_value)
         entry = tk.Entry(
             entry_frame,
+            textvariable=self.entry_var,
             width=40,
-            font=("Arial", 11),
+            font=shared_font("Arial", 11),
             bd=2,
             relief=tk.SOLID
         )
         entry.pack(padx=2, pady=2)
-        entry.insert(0, current_value)
         entry.focus()
         entry.select_range(0, tk.END)
 
         # Help text
-        help_frame = tk.Frame(content, bg="#ecf0f1", bd=1, relief=tk.SOLID)
+        help_frame = tk.Frame(content, bg=HELP_BG, bd=1, relief=tk.SOLID)
         help_frame.pack(fill=tk.X, pady=(10, 0))
 
-        tk.Label(
+        ttk.Label(
             help_frame,
             text="💡 Examples:  10[W]  •  5.5[mm]  •  300[K]  •  0.8 (unitless)",
-            font=("Arial", 8),
-            fg="#34495e",
-            bg="#ecf0f1",
+            style="EditorHelp.TLabel",
             anchor=tk.W
         ).pack(padx=8, pady=5)
 
         # Feedback label
-        feedback_label = tk.Label(
+        feedback_label = ttk.Label(
             content,
             text="",
-            font=("Arial", 8),
-            bg="white",
-            fg="#e74c3c"
+            style="EditorFeedback.TLabel"
         )
         feedback_label.pack()
 
@@ -141,30 +179,33 @@ class ParameterEditor:
 
     def _create_buttons(self, dialog, entry, param_name, current_value, description, item):
         """Create action buttons"""
-        btn_frame = tk.Frame(dialog, bg="#f8f9fa")
+        btn_frame = tk.Frame(dialog, bg=BUTTON_BAR_BG)
         btn_frame.pack(fill=tk.X, side=tk.BOTTOM)
 
-        btn_inner = tk.Frame(btn_frame, bg="#f8f9fa")
+        btn_inner = tk.Frame(btn_frame, bg=BUTTON_BAR_BG)
         btn_inner.pack(pady=12)
 
         def save():
             new_value = entry.get().strip()
             if new_value:
-                self.param_tree.item(item, values=(param_name, new_value, description))
-                # Mark as modified
-                self.param_tree.item(item, tags=('modified',))
+                # Update value and mark as modified in one call
+                self.param_tree.item(
+                    item, values=(param_name, new_value, description), tags=('modified',)
+                )
                 dialog.destroy()
 
+        # Classic buttons: native ttk themes (vista, aqua) ignore the
+        # background color, leaving white text on a light button face
         tk.Button(
             btn_inner,
             text="✓ Apply Change",
             command=save,
-            bg="#27ae60",
-            fg="white",
+            bg=SUCCESS_COLOR,
+            fg=WHITE,
             relief=tk.FLAT,
             padx=30,
             pady=8,
-            font=("Arial", 9, "bold"),
+            font=shared_font("Arial", 9, "bold"),
             cursor="hand2"
         ).pack(side=tk.LEFT, padx=5)
 
@@ -172,12 +213,12 @@ class ParameterEditor:
             btn_inner,
             text="Cancel",
             command=dialog.destroy,
-            bg="#95a5a6",
-            fg="white",
+            bg=NEUTRAL_COLOR,
+            fg=WHITE,
             relief=tk.FLAT,
             padx=30,
             pady=8,
-            font=("Arial", 9),
+            font=shared_font("Arial", 9),
             cursor="hand2"
         ).pack(side=tk.LEFT, padx=5)
 
@@ -185,20 +226,36 @@ class ParameterEditor:
         entry.bind('<Escape>', lambda e: dialog.destroy())
 
     def _setup_validation(self, entry, feedback_label, current_value):
-        """Setup real-time validation"""
-        def validate_input(*args):
-            value = entry.get().strip()
+        """
+        Setup real-time validation.
+
+        Tk's key validation hands over the proposed value (%P) directly;
+        the feedback label is updated once per idle turn for the final value.
+        """
+        proposed_value = str(current_value)
+
+        def update_feedback():
+            self._pending_validation = None
+            if not feedback_label.winfo_exists():
+                return  # Dialog closed before the idle callback ran
+            value = proposed_value.strip()
             if not value:
-                feedback_label.config(text="⚠ Value cannot be empty", fg="#e74c3c")
-                return False
+                feedback_label.config(text="⚠ Value cannot be empty", foreground=ERROR_COLOR)
             elif value == current_value:
-                feedback_label.config(text="ℹ No change", fg="#95a5a6")
-                return True
+                feedback_label.config(text="ℹ No change", foreground=NEUTRAL_COLOR)
+            elif _UNIT_RE.fullmatch(value) is not None:
+                feedback_label.config(text="✓ Valid", foreground=SUCCESS_COLOR)
             else:
-                feedback_label.config(text="✓ Valid", fg="#27ae60")
-                return True
+                # Expressions such as L/2 are allowed; Comsol evaluates them
+                feedback_label.config(text="ℹ Expression (evaluated by Comsol)", foreground=NEUTRAL_COLOR)
+
+        def validate_key(proposed):
+            nonlocal proposed_value
+            proposed_value = proposed
+            if self._pending_validation is None:
+                self._pending_validation = self.root.after_idle(update_feedback)
+            # Edits are never rejected; Tk disables validation on a non-bool result
+            return True
 
-        entry_var = tk.StringVar()
-        entry_var.trace('w', validate_input)
-        entry.config(textvariable=entry_var)
-        entry_var.set(current_value)
+        entry.config(validate='key', validatecommand=(entry.register(validate_key), '%P'))
+        update_feedback()
@@ -1,36 +1,22 @@
 """
 Launcher script generation feature
 """
+import string
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tkinter import messagebox
-from typing import Dict
+from typing import Dict, Optional
 
 
-class LauncherGenerator:
-    """Generates standalone launcher scripts for projects"""
-
-    @staticmethod
-    def generate(project_info: Dict) -> bool:
-        """
-        Generate launcher scripts for a project.
-
-        Args:
-            project_info: Dictionary with project metadata
-
-        Returns:
-            True if successful, False otherwise
-        """
-        model_path = project_info['file_path']
-        project_folder = project_info['folder']
-
-        # Python launcher script
-        py_script = f'''#!/usr/bin/env python3
-"""Launcher for {project_info['display_name']}"""
-import subprocess, sys
+# Python launcher script ($display_name and $model_name are filled per project)
+_PY_TEMPLATE = string.Template('''#!/usr/bin/env python3
+"""Launcher for ${display_name}"""
+import os, subprocess, sys
 from pathlib import Path
 
-model_path = Path(__file__).parent / "{model_path.name}"
+model_path = Path(__file__).parent / "${model_name}"
 
 try:
     import mph
@@ -43,21 +29,21 @@ try:
     print("Connecting to Comsol...")
     client = mph.start()
     print("Loading model...")
-    model = client.load(str(model_path))
+    model = client.load(os.fspath(model_path))
     print("Building...")
     model.build()
     print("Solving...")
     model.solve()
-    output = model_path.parent / f"{{model_path.stem}}_result.mph"
-    model.save(str(output))
-    print(f"\\n✓ Success! Results: {{output}}")
+    output = model_path.parent / f"{model_path.stem}_result.mph"
+    model.save(os.fspath(output))
+    print(f"\\n✓ Success! Results: {output}")
 except Exception as e:
-    print(f"\\nERROR: {{e}}")
+    print(f"\\nERROR: {e}")
     sys.exit(1)
-'''
+''')
 
-        # Shell script
-        sh_script = f'''#!/bin/bash
+# Shell script
+_SH_SCRIPT = '''#!/bin/bash
 cd "$(dirname "$0")"
 if command -v uv &> /dev/null; then
     [ ! -d ".venv" ] && uv venv
@@ -68,8 +54,8 @@ else
 fi
 '''
 
-        # Batch script
-        bat_script = f'''@echo off
+# Batch script
+_BAT_SCRIPT = '''@echo off
 cd /d "%~dp0"
 where uv >nul 2>nul
 if %ERRORLEVEL% equ 0 (
@@ -82,16 +68,79 @@ if %ERRORLEVEL% equ 0 (
 pause
 '''
 
-        try:
-            (project_folder / "run_simulation.py").write_text(py_script, encoding='utf-8')
-            (project_folder / "run.sh").write_text(sh_script, encoding='utf-8')
-            (project_folder / "run.bat").write_text(bat_script, encoding='utf-8')
+# Constant scripts encoded once. Bytes are written as-is, so line endings
+# are fixed here: LF for the shell script, CRLF for the batch file.
+_SH_BYTES = _SH_SCRIPT.encode('utf-8')
+_BAT_BYTES = _BAT_SCRIPT.replace('\n', '\r\n').encode('utf-8')
+
+
+class LauncherGenerator:
+    """Generates standalone launcher scripts for projects"""
 
-            if sys.platform != 'win32':
-                import stat
-                sh_path = project_folder / "run.sh"
-                sh_path.chmod(sh_path.stat().st_mode | stat.S_IXUSR)
+    @staticmethod
+    def generate(project_info: Dict, root):
+        """
+        Generate launcher scripts for a project in a background thread
+        and report the result in a message box.
 
+        Args:
+            project_info: Dictionary with project metadata
+            root: Tk root used to marshal the report back to the Tk thread
+        """
+        project_folder = project_info['file_path'].parent
+
+        def generate_thread():
+            try:
+                LauncherGenerator.write_scripts(project_info)
+                root.after(0, LauncherGenerator._report, project_folder, None)
+            except Exception as e:
+                root.after(0, LauncherGenerator._report, project_folder, str(e))
+
+        threading.Thread(target=generate_thread, daemon=True).start()
+
+    @staticmethod
+    def write_scripts(project_info: Dict):
+        """
+        Write the launcher scripts next to the model.
+
+        The three files are independent, so they are written concurrently.
+
+        Args:
+            project_info: Dictionary with project metadata
+
+        Raises:
+            OSError: If a script cannot be written
+        """
+        model_path = project_info['file_path']
+        project_folder = project_info['file_path'].parent
+
+        py_script = _PY_TEMPLATE.substitute(
+            display_name=project_info['display_name'],
+            model_name=model_path.name
+        )
+
+        scripts = (
+            ("run_simulation.py", py_script.encode('utf-8')),
+            ("run.sh", _SH_BYTES),
+            ("run.bat", _BAT_BYTES)
+        )
+        with ThreadPoolExecutor(max_workers=len(scripts)) as pool:
+            futures = [
+                pool.submit((project_folder / name).write_bytes, payload)
+                for name, payload in scripts
+            ]
+            for future in futures:
+                future.result()
+
+        if sys.platform != 'win32':
+            import stat
+            sh_path = project_folder / "run.sh"
+            sh_path.chmod(sh_path.stat().st_mode | stat.S_IXUSR)
+
+    @staticmethod
+    def _report(project_folder: Path, error: Optional[str]):
+        """Show the outcome of generate() (Tk thread)"""
+        if error is None:
             messagebox.showinfo(
                 "✓ Launcher Created",
                 f"Launcher scripts created!\n\n"
@@ -101,7 +150,5 @@ pause
                 f"  • run.sh (Mac/Linux)\n"
                 f"  • run.bat (Windows)"
             )
-            return True
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to create launchers:\n{str(e)}")
-            return False
+        else:
+            messagebox.showerror("Error", f"Failed to create launchers:\n{error}")
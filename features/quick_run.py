@@ -3,10 +3,13 @@ Quick Run feature - Simple one-click simulation execution
 """
 import tkinter as tk
 from tkinter import ttk, messagebox
+import os
+import queue
 import threading
 from pathlib import Path
 from typing import Dict
 
+from utils import mph_client
 from utils.dependency_manager import DependencyManager
 
 
@@ -26,6 +29,10 @@ class QuickRunFeature:
         self.root = root
         self.base_path = base_path
         self.dep_manager = DependencyManager()
+        self._messages = queue.Queue()
+        self._progress_window = None
+        self._last_model = None  # (path, mtime_ns, model) of the previous run
+        self._running = False  # One run at a time: the queue and window are shared
 
     def run(self, project_info: Dict, on_complete_callback=None):
         """
@@ -35,6 +42,14 @@ class QuickRunFeature:
             project_info: Dictionary with project metadata
             on_complete_callback: Function to call when complete
         """
+        if self._running:
+            messagebox.showinfo(
+                "Simulation Running",
+                "A simulation is already running.\n\n"
+                "Wait for it to finish before starting another."
+            )
+            return
+
         if not self.dep_manager.check_mph_available():
             messagebox.showerror(
                 "mph Not Available",
@@ -45,87 +60,156 @@ class QuickRunFeature:
             return
 
         model_path = project_info['file_path']
+        self._running = True
         progress = self._show_progress_window(project_info['display_name'])
+        self.root.after(50, self._drain, progress, on_complete_callback)
 
         def run_thread():
             try:
                 # Setup UV environment if available
                 if self.dep_manager.check_uv_available():
-                    self._update_progress(progress, "Setting up UV environment...")
+                    self._update_progress("Setting up UV environment...")
                     self.dep_manager.setup_uv_environment(self.base_path)
 
-                # Import mph
-                import mph
-
-                # Connect to Comsol
-                self._update_progress(progress, "Connecting to Comsol server...")
-                client = mph.start()
-
-                # Load model
-                self._update_progress(progress, f"Loading {model_path.name}...")
-                model = client.load(str(model_path))
-
-                # Build model
-                self._update_progress(progress, "Building model...")
-                model.build()
+                # Connect to Comsol (reuses the client from earlier runs)
+                self._update_progress("Connecting to Comsol server...")
+                client = mph_client.get_client()
+
+                # Load and build model, reusing the one already built by the
+                # previous run when the file has not changed since
+                stamp = model_path.stat().st_mtime_ns
+                last = self._last_model
+                if last is not None and last[0] == model_path and last[1] == stamp:
+                    model = last[2]
+                else:
+                    # Free the previous model first; the shared client
+                    # keeps every loaded model in its JVM until removed
+                    if last is not None:
+                        self._last_model = None
+                        self._remove_model(client, last[2])
+
+                    self._update_progress(f"Loading {model_path.name}...")
+                    model = client.load(os.fspath(model_path))
+
+                    self._update_progress("Building model...")
+                    model.build()
+                    self._last_model = (model_path, stamp, model)
 
                 # Solve model
-                self._update_progress(progress, "Solving model (please wait)...")
+                self._update_progress("Solving model (please wait)...")
                 model.solve()
 
                 # Export results
                 output_path = model_path.parent / f"{model_path.stem}_result.mph"
-                self._update_progress(progress, "Saving results...")
-                model.save(str(output_path))
+                self._update_progress("Saving results...")
+                model.save(os.fspath(output_path))
 
                 # Success
-                self.root.after(0, lambda: progress.destroy())
-                self.root.after(0, lambda: messagebox.showinfo(
-                    "✓ Success",
+                outcome = (
+                    messagebox.showinfo, "✓ Success",
                     f"Simulation completed!\n\nResults saved to:\n{output_path.name}"
-                ))
+                )
 
             except Exception as e:
-                self.root.after(0, lambda: progress.destroy())
-                self.root.after(0, lambda: messagebox.showerror(
-                    "Error",
+                outcome = (
+                    messagebox.showerror, "Error",
                     f"Simulation failed:\n\n{str(e)}"
-                ))
-            finally:
-                if on_complete_callback:
-                    self.root.after(0, on_complete_callback)
+                )
+
+            self._messages.put(('finished', outcome))
 
         thread = threading.Thread(target=run_thread, daemon=True)
         thread.start()
 
+    @staticmethod
+    def _remove_model(client, model):
+        """Unload a model from the Comsol client (worker thread)"""
+        try:
+            client.remove(model)
+        except Exception:
+            pass  # Already gone, or the server went away
+
     def _show_progress_window(self, project_name):
-        """Show progress window"""
+        """Show the progress window, reusing the one from the previous run"""
+        progress = self._progress_window
+        if progress is None or not progress.winfo_exists():
+            progress = self._progress_window = self._create_progress_window()
+
+        progress.title_label.config(text=f"Running: {project_name}")
+        progress.status_label.config(text="Initializing...")
+        progress.progress_bar.start(10)
+        progress.deiconify()
+
+        return progress
+
+    def _create_progress_window(self):
+        """Build the (initially withdrawn) progress window"""
         progress = tk.Toplevel(self.root)
+        progress.withdraw()
         progress.title("Running Simulation")
         progress.geometry("400x150")
         progress.resizable(False, False)
         progress.transient(self.root)
 
-        tk.Label(
+        progress.title_label = tk.Label(
             progress,
-            text=f"Running: {project_name}",
             font=("Arial", 11, "bold")
-        ).pack(pady=(20, 10))
+        )
+        progress.title_label.pack(pady=(20, 10))
 
         progress.status_label = tk.Label(
             progress,
-            text="Initializing...",
             font=("Arial", 10)
         )
         progress.status_label.pack(pady=10)
 
-        progress_bar = ttk.Progressbar(progress, mode='indeterminate', length=300)
-        progress_bar.pack(pady=20)
-        progress_bar.start(10)
+        progress.progress_bar = ttk.Progressbar(progress, mode='indeterminate', length=300)
+        progress.progress_bar.pack(pady=20)
 
         return progress
 
-    def _update_progress(self, window, message):
-        """Update progress window message"""
-        if window and window.winfo_exists():
-            self.root.after(0, lambda: window.status_label.config(text=message))
+    def _update_progress(self, message):
+        """Queue a progress window message (worker thread)"""
+        self._messages.put(('status', message))
+
+    def _drain(self, progress, on_complete_callback):
+        """
+        Apply queued worker messages, polling until the run finishes (Tk thread).
+
+        Only the latest status is shown; earlier ones in the same poll are skipped.
+        """
+        status = None
+        while True:
+            try:
+                kind, payload = self._messages.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == 'status':
+                status = payload
+            else:
+                self._running = False
+                if on_complete_callback:
+                    on_complete_callback()
+                self._finish(progress, *payload)
+                return
+
+        if status is not None and progress.winfo_exists():
+            progress.status_label.config(text=status)
+        self.root.after(50, self._drain, progress, on_complete_callback)
+
+    def _finish(self, progress, show_message, title, message):
+        """
+        Hide the progress window and report the outcome (Tk thread).
+
+        Args:
+            progress: Progress window to hide
+            show_message: messagebox.showinfo or messagebox.showerror
+            title: Message box title
+            message: Message box text
+        """
+        if progress.winfo_exists():
+            # Hide rather than destroy so the next run can reuse it
+            progress.progress_bar.stop()
+            progress.withdraw()
+        show_message(title, message)
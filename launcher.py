@@ -4,54 +4,89 @@ Comsol Project Manager - Python Launcher
 Simple launcher that ensures dependencies are installed before running
 """
 
+import atexit
+import importlib.metadata
+import os
+import shutil
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
+# Directory containing the launcher (and the app it starts)
+_HERE = Path(__file__).resolve().parent
 
-def log(message, logfile="launcher.log"):
-    """Log message to file and print to console"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_entry = f"[{timestamp}] {message}\n"
+# launcher.log, opened once by main() with a block buffer
+_log_file = None
 
-    # Append to log file
-    with open(logfile, "a", encoding="utf-8") as f:
-        f.write(log_entry)
+
+def log(message, flush=False):
+    """
+    Log message to file and print to console.
+
+    Lines are buffered and written in blocks; pass flush=True for lines
+    that must reach the file right away (errors, before the app starts).
+    """
+    if _log_file is not None:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        _log_file.write(f"[{timestamp}] {message}\n")
+        if flush:
+            _log_file.flush()
 
     # Also print to console
     print(message)
 
 
+@lru_cache(maxsize=1)
 def check_uv_available():
-    """Check if UV is installed"""
+    """Check if UV is installed (cached; only spawns uv if it is on PATH)"""
+    uv_path = shutil.which("uv")
+    if uv_path is None:
+        return False
     try:
         result = subprocess.run(
-            ["uv", "--version"],
-            capture_output=True,
-            text=True
+            [uv_path, "--version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
         )
         return result.returncode == 0
-    except (FileNotFoundError, PermissionError, OSError):
+    except OSError:
         return False
 
 
+def venv_has_packages(venv_path, packages):
+    """Check the venv's installed-distribution metadata without running its Python"""
+    if sys.platform == "win32":
+        site_dirs = [venv_path / "Lib" / "site-packages"]
+    else:
+        site_dirs = list(venv_path.glob("lib/python*/site-packages"))
+
+    installed = set()
+    for dist in importlib.metadata.distributions(path=[str(d) for d in site_dirs]):
+        name = dist.metadata['Name']
+        if name:
+            installed.add(name.lower())
+    return all(package in installed for package in packages)
+
+
 def setup_with_uv():
     """Setup environment using UV (fast)"""
     log("[*] Using UV for dependency management...")
 
-    venv_path = Path(__file__).parent / ".venv"
+    venv_path = _HERE / ".venv"
 
     # Create venv if needed
     if not venv_path.exists():
         log("[*] Creating UV virtual environment...")
         result = subprocess.run(
             ["uv", "venv"],
-            capture_output=True,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
         )
         if result.returncode != 0:
-            log(f"ERROR: Failed to create venv: {result.stderr}")
+            log(f"ERROR: Failed to create venv: {result.stderr.decode('utf-8', errors='replace')}", flush=True)
             raise subprocess.CalledProcessError(result.returncode, "uv venv")
         log("[+] Virtual environment created")
 
@@ -59,23 +94,31 @@ def setup_with_uv():
     log("[*] Installing dependencies...")
     result = subprocess.run(
         ["uv", "pip", "install", "mph", "numpy"],
-        capture_output=True,
-        text=True
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
     )
     if result.returncode != 0:
-        log(f"ERROR: Failed to install dependencies: {result.stderr}")
+        log(f"ERROR: Failed to install dependencies: {result.stderr.decode('utf-8', errors='replace')}", flush=True)
         raise subprocess.CalledProcessError(result.returncode, "uv pip install")
     log("[+] Dependencies ready")
 
     # Run application
-    log("[*] Launching Comsol Project Manager...")
+    log("[*] Launching Comsol Project Manager...", flush=True)
     print()
     print("NOTE: First-time Java/Comsol connection may show warnings - this is normal")
     print("      The application will continue loading...")
     print()
 
+    command = ["uv", "run", "python", "comsol_manager.py"]
+    if sys.platform != "win32":
+        # Replace the launcher with the app instead of waiting on it as a
+        # parent; exec does not return and skips atexit, so flush first
+        log("[*] Handing over to the application process", flush=True)
+        sys.stdout.flush()
+        os.execvp(command[0], command)
+
     result = subprocess.run(
-        ["uv", "run", "python", "comsol_manager.py"],
+        command,
         capture_output=False  # Let output go to console
     )
     log(f"Application exited with code {result.returncode}")
@@ -87,18 +130,18 @@ def setup_with_pip():
     log("[*] Using pip for dependency management...")
     print("[i] Install UV for faster setup: pip install uv")
 
-    venv_path = Path(__file__).parent / ".venv"
+    venv_path = _HERE / ".venv"
 
     # Create venv if needed
     if not venv_path.exists():
         log("[*] Creating virtual environment...")
         result = subprocess.run(
             [sys.executable, "-m", "venv", ".venv"],
-            capture_output=True,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
         )
         if result.returncode != 0:
-            log(f"ERROR: Failed to create venv: {result.stderr}")
+            log(f"ERROR: Failed to create venv: {result.stderr.decode('utf-8', errors='replace')}", flush=True)
             raise subprocess.CalledProcessError(result.returncode, "venv creation")
         log("[+] Virtual environment created")
 
@@ -110,20 +153,23 @@ def setup_with_pip():
         venv_python = venv_path / "bin" / "python"
         venv_pip = venv_path / "bin" / "pip"
 
-    # Install dependencies
-    log("[*] Installing dependencies...")
-    result = subprocess.run(
-        [str(venv_pip), "install", "mph", "numpy"],
-        capture_output=True,
-        text=True
-    )
-    if result.returncode != 0:
-        log(f"ERROR: pip install failed: {result.stderr}")
-        raise subprocess.CalledProcessError(result.returncode, "pip install")
-    log("[+] Dependencies installed")
+    # Install dependencies (skipped when the venv already has them)
+    if venv_has_packages(venv_path, ("mph", "numpy")):
+        log("[+] Dependencies already installed")
+    else:
+        log("[*] Installing dependencies...")
+        result = subprocess.run(
+            [str(venv_pip), "install", "mph", "numpy"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        if result.returncode != 0:
+            log(f"ERROR: pip install failed: {result.stderr.decode('utf-8', errors='replace')}", flush=True)
+            raise subprocess.CalledProcessError(result.returncode, "pip install")
+        log("[+] Dependencies installed")
 
     # Run application
-    log("[*] Launching Comsol Project Manager...")
+    log("[*] Launching Comsol Project Manager...", flush=True)
     print()
     print("NOTE: First-time Java/Comsol connection may show warnings - this is normal")
     print("      The application will continue loading...")
@@ -139,10 +185,13 @@ def setup_with_pip():
 
 def main():
     """Main entry point"""
-    # Initialize log file
-    logfile = Path(__file__).parent / "launcher.log"
-    with open(logfile, "w", encoding="utf-8") as f:
-        f.write(f"[{datetime.now()}] Comsol Project Manager Starting...\n")
+    global _log_file
+
+    # Initialize log file, kept open for every later log() call
+    logfile = _HERE / "launcher.log"
+    _log_file = open(logfile, "w", encoding="utf-8", buffering=8192)
+    atexit.register(_log_file.close)
+    _log_file.write(f"[{datetime.now()}] Comsol Project Manager Starting...\n")
 
     print("=" * 60)
     print("  Comsol Project Manager - Starting...")
@@ -150,11 +199,9 @@ def main():
     print()
 
     # Change to script directory
-    script_dir = Path(__file__).parent
-    import os
-    os.chdir(script_dir)
+    os.chdir(_HERE)
 
-    log(f"Working directory: {script_dir}")
+    log(f"Working directory: {_HERE}")
 
     try:
         if check_uv_available():
@@ -177,7 +224,7 @@ def main():
         print()
         print(f"[!] Error during setup: {e}")
         print("[!] Check launcher.log for details")
-        log(f"ERROR: Setup failed - {e}")
+        log(f"ERROR: Setup failed - {e}", flush=True)
         sys.exit(1)
     except KeyboardInterrupt:
         print()
@@ -188,7 +235,7 @@ def main():
         print()
         print(f"[!] Unexpected error: {e}")
         print("[!] Check launcher.log for details")
-        log(f"ERROR: Unexpected error - {e}")
+        log(f"ERROR: Unexpected error - {e}", flush=True)
         sys.exit(1)
 
 
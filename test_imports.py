@@ -2,10 +2,16 @@
 """
 Quick diagnostic script to test if all required modules can be imported.
 Run this to diagnose installation issues.
+
+By default modules are only located (no package code runs); pass --deep
+to also import them.
 """
 
+import importlib.util
 import sys
 
+deep = "--deep" in sys.argv[1:]
+
 print("="*70)
 print("ComsoleLauncher - Import Diagnostic Test")
 print("="*70)
@@ -29,7 +35,10 @@ passed = []
 
 for module_name, description in modules_to_test:
     try:
-        __import__(module_name)
+        if importlib.util.find_spec(module_name) is None:
+            raise ImportError(f"No module named '{module_name}'")
+        if deep:
+            __import__(module_name)
         print(f"✓ {module_name:20} - {description}")
         passed.append(module_name)
     except ImportError as e:
@@ -0,0 +1,72 @@
+"""
+Tests for saving modified parameters into .mph files
+"""
+import os
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from utils.mph_parser import MphParser
+from utils.mph_saver import MphSaver
+
+
+DMODEL = (
+    '<model>'
+    '<expressions name="L" expr="007" descr="Length"/>'
+    '<expressions name="W" expr="2[mm]" descr="Width"/>'
+    '</model>'
+)
+
+
+class SaveModifiedMphTest(unittest.TestCase):
+    """save_modified_mph round-trips through MphParser"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.mph_path = Path(self._tmp.name) / "model.mph"
+        with zipfile.ZipFile(self.mph_path, 'w', zipfile.ZIP_DEFLATED) as z:
+            z.writestr('dmodel.xml', DMODEL)
+            z.writestr('savepoint1/data.mphbin', b'\0' * 1000)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _saved_parameters(self, new_mph):
+        return {
+            name: value
+            for name, value, _ in MphParser.load_parameters_from_mph(new_mph)
+        }
+
+    def test_integer_like_values_round_trip(self):
+        # The inspect dialog passes every value as the string shown in the tree
+        success, message, new_mph, _ = MphSaver.save_modified_mph(
+            self.mph_path, {'L': '007', 'W': '5'}
+        )
+        self.assertTrue(success, message)
+        self.assertEqual(self._saved_parameters(new_mph), {'L': '007', 'W': '5'})
+
+    def test_non_string_values_are_saved_as_str(self):
+        success, message, new_mph, _ = MphSaver.save_modified_mph(
+            self.mph_path, {'L': 5, 'W': 2.5}
+        )
+        self.assertTrue(success, message)
+        self.assertEqual(self._saved_parameters(new_mph), {'L': '5', 'W': '2.5'})
+
+    def test_backup_is_independent_of_the_original(self):
+        backup_path = self.mph_path.with_name("model_backup.mph")
+        os.link(self.mph_path, backup_path)  # Left by an older version
+        original = self.mph_path.read_bytes()
+
+        success, message, _, backup = MphSaver.save_modified_mph(
+            self.mph_path, {'W': '3[mm]'}
+        )
+        self.assertTrue(success, message)
+        self.assertFalse(os.path.samefile(self.mph_path, backup))
+
+        self.mph_path.write_bytes(b'rewritten in place')
+        self.assertEqual(backup.read_bytes(), original)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Tests for scanning project folders
+"""
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.project_scanner import CACHE_FILENAME, ProjectScanner
+
+
+class ScanCacheTest(unittest.TestCase):
+    """The on-disk scan cache never hides projects"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        for name in ("a.mph", "b.mph"):
+            (self.root / name).write_bytes(b"PK")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_malformed_entries_are_rescanned_and_rewritten(self):
+        stat_info = (self.root / "b.mph").stat()
+        cache_path = self.root / CACHE_FILENAME
+        cache_path.write_text(json.dumps({
+            "a.mph": [1, 2],
+            "b.mph": [stat_info.st_size, stat_info.st_mtime, {"size_str": 5}]
+        }), encoding="utf-8")
+
+        projects = ProjectScanner(self.root).scan_projects()
+
+        self.assertEqual(sorted(projects), ["a.mph", "b.mph"])
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+        self.assertTrue(all(ProjectScanner._valid_cache_entry(e) for e in cache.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
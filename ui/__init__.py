@@ -4,5 +4,8 @@ UI components for Comsol Project Manager
 from .tooltip import ToolTip
 from .main_window import MainWindowUI
 from .project_card import ProjectCardManager
+from .tree_utils import insert_rows, LazyRows
+from .fonts import shared_font
+from .styles import register_styles
 
-__all__ = ['ToolTip', 'MainWindowUI', 'ProjectCardManager']
+__all__ = ['ToolTip', 'MainWindowUI', 'ProjectCardManager', 'insert_rows', 'LazyRows', 'shared_font', 'register_styles']
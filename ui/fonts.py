@@ -0,0 +1,25 @@
+"""
+Shared named fonts
+"""
+import tkinter.font as tkfont
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def shared_font(family: str, size: int, weight: str = "normal") -> tkfont.Font:
+    """
+    Return a named font shared by every widget using the same spec.
+
+    Tk resolves a named font once; passing a tuple makes it parse the
+    spec and look up metrics again for each widget. Requires an existing
+    Tk root.
+
+    Args:
+        family: Font family, e.g. "Arial"
+        size: Point size
+        weight: "normal" or "bold"
+
+    Returns:
+        tkinter.font.Font instance
+    """
+    return tkfont.Font(family=family, size=size, weight=weight)
@@ -6,6 +6,8 @@ from tkinter import ttk
 from pathlib import Path
 from typing import Callable, Dict
 
+from .fonts import shared_font
+from .styles import register_styles
 from .tooltip import ToolTip
 
 
@@ -15,6 +17,10 @@ class MainWindowUI:
     Provides a modern visual design with status indicators, project grid, and action buttons.
     """
 
+    # Options shared by every action bar button
+    _BUTTON_BASE = {"fg": "white", "relief": tk.FLAT, "cursor": "hand2"}
+    _ACTION_FONT = ("Arial", 10)
+
     def __init__(
         self,
         root,
@@ -38,13 +44,16 @@ class MainWindowUI:
 
         # Widgets that need to be accessed later
         self.canvas = None
-        self.scrollable_frame = None
+        self.scrollbar = None
+        self._wheel_delta = 0
+        self._wheel_after = None
         self.quick_run_button = None
         self.launcher_button = None
         self.advanced_button = None
         self.inspect_button = None
+        self.install_buttons = {}
 
-    def setup(self, callbacks: Dict[str, Callable]) -> tk.Frame:
+    def setup(self, callbacks: Dict[str, Callable]) -> tk.Canvas:
         """
         Setup the complete UI layout.
 
@@ -52,15 +61,53 @@ class MainWindowUI:
             callbacks: Dictionary mapping button names to callback functions
 
         Returns:
-            Frame containing the scrollable project area
+            Canvas the project cards are drawn on
         """
-        self._create_title_section()
-        self._create_status_section(callbacks)
-        self._create_path_controls(callbacks)
-        self._create_projects_grid()
-        self._create_action_buttons(callbacks)
-
-        return self.scrollable_frame
+        # Build hidden and lay everything out in one pass before showing
+        self.root.withdraw()
+        try:
+            register_styles(self._styles())
+            self._create_title_section()
+            self._create_status_section(callbacks)
+            self._create_path_controls(callbacks)
+            self._create_projects_grid()
+            self._create_action_buttons(callbacks)
+        finally:
+            self.root.update_idletasks()
+            self.root.deiconify()
+
+        return self.canvas
+
+    @staticmethod
+    def _styles():
+        """Named ttk styles used by the main window labels"""
+        status_font = shared_font("Arial", 9, "bold")
+        return {
+            "Title.TLabel": dict(
+                background="#2c3e50", foreground="white", font=shared_font("Arial", 18, "bold")
+            ),
+            "Subtitle.TLabel": dict(
+                background="#2c3e50", foreground="#ecf0f1", font=shared_font("Arial", 10)
+            ),
+            "Status.Good.TLabel": dict(
+                background="#ecf0f1", foreground="#27ae60", font=status_font
+            ),
+            "Status.Bad.TLabel": dict(
+                background="#ecf0f1", foreground="#e74c3c", font=status_font
+            ),
+            "Status.Warn.TLabel": dict(
+                background="#ecf0f1", foreground="#f39c12", font=status_font
+            ),
+            "PathCaption.TLabel": dict(
+                background="white", font=shared_font("Arial", 9, "bold")
+            ),
+            "Path.TLabel": dict(
+                background="white", foreground="#3498db", font=shared_font("Arial", 9)
+            ),
+            "Section.TLabel": dict(
+                background="white", font=shared_font("Arial", 11, "bold")
+            )
+        }
 
     def _create_title_section(self):
         """Create title bar at top"""
@@ -68,20 +115,16 @@ class MainWindowUI:
         title_frame.pack(fill=tk.X)
         title_frame.pack_propagate(False)
 
-        tk.Label(
+        ttk.Label(
             title_frame,
             text="Comsol Project Manager",
-            font=("Arial", 18, "bold"),
-            bg="#2c3e50",
-            fg="white"
+            style="Title.TLabel"
         ).pack(pady=(10, 5))
 
-        tk.Label(
+        ttk.Label(
             title_frame,
             text="Manage and run Comsol Multiphysics simulations via Python",
-            font=("Arial", 10),
-            bg="#2c3e50",
-            fg="#ecf0f1"
+            style="Subtitle.TLabel"
         ).pack()
 
     def _create_status_section(self, callbacks: Dict):
@@ -95,29 +138,25 @@ class MainWindowUI:
 
         # mph status
         mph_status = "✓ mph library" if self.mph_available else "✗ mph library"
-        mph_color = "#27ae60" if self.mph_available else "#e74c3c"
-        tk.Label(
+        mph_style = "Status.Good.TLabel" if self.mph_available else "Status.Bad.TLabel"
+        ttk.Label(
             status_inner,
             text=mph_status,
-            fg=mph_color,
-            bg="#ecf0f1",
-            font=("Arial", 9, "bold")
+            style=mph_style
         ).pack(side=tk.LEFT, padx=10)
 
         # UV status
         uv_status = "✓ UV" if self.uv_available else "✗ UV"
-        uv_color = "#27ae60" if self.uv_available else "#f39c12"
-        tk.Label(
+        uv_style = "Status.Good.TLabel" if self.uv_available else "Status.Warn.TLabel"
+        ttk.Label(
             status_inner,
             text=uv_status,
-            fg=uv_color,
-            bg="#ecf0f1",
-            font=("Arial", 9, "bold")
+            style=uv_style
         ).pack(side=tk.LEFT, padx=10)
 
         # Install buttons if needed
         if not self.uv_available and 'install_uv' in callbacks:
-            tk.Button(
+            self.install_buttons['uv'] = tk.Button(
                 status_inner,
                 text="Install UV",
                 command=callbacks['install_uv'],
@@ -126,10 +165,11 @@ class MainWindowUI:
                 relief=tk.FLAT,
                 padx=10,
                 font=("Arial", 8)
-            ).pack(side=tk.LEFT, padx=5)
+            )
+            self.install_buttons['uv'].pack(side=tk.LEFT, padx=5)
 
         if not self.mph_available and 'install_mph' in callbacks:
-            tk.Button(
+            self.install_buttons['mph'] = tk.Button(
                 status_inner,
                 text="Install mph",
                 command=callbacks['install_mph'],
@@ -138,26 +178,24 @@ class MainWindowUI:
                 relief=tk.FLAT,
                 padx=10,
                 font=("Arial", 8)
-            ).pack(side=tk.LEFT, padx=5)
+            )
+            self.install_buttons['mph'].pack(side=tk.LEFT, padx=5)
 
     def _create_path_controls(self, callbacks: Dict):
         """Create path display and controls"""
         path_frame = tk.Frame(self.root, bg="white", height=40)
         path_frame.pack(fill=tk.X, padx=10, pady=(10, 5))
 
-        tk.Label(
+        ttk.Label(
             path_frame,
             text="📁 Projects:",
-            bg="white",
-            font=("Arial", 9, "bold")
+            style="PathCaption.TLabel"
         ).pack(side=tk.LEFT, padx=(10, 5))
 
-        tk.Label(
+        ttk.Label(
             path_frame,
             text=str(self.projects_path),
-            bg="white",
-            fg="#3498db",
-            font=("Arial", 9)
+            style="Path.TLabel"
         ).pack(side=tk.LEFT, padx=5)
 
         if 'browse_folder' in callbacks:
@@ -189,43 +227,62 @@ class MainWindowUI:
         projects_outer = tk.Frame(self.root, bg="white")
         projects_outer.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-        tk.Label(
+        ttk.Label(
             projects_outer,
             text="Available Projects",
-            bg="white",
-            font=("Arial", 11, "bold"),
+            style="Section.TLabel",
             anchor=tk.W
         ).pack(fill=tk.X, padx=10, pady=(5, 10))
 
-        # Scrollable canvas for project cards
+        # Scrollable canvas for project cards; ProjectCardManager places the
+        # visible cards on it and sets its scroll region and yscrollcommand
         self.canvas = tk.Canvas(
             projects_outer,
             bg="white",
             highlightthickness=0
         )
-        scrollbar = tk.Scrollbar(
+        self.scrollbar = tk.Scrollbar(
             projects_outer,
             orient="vertical",
             command=self.canvas.yview
         )
 
-        self.scrollable_frame = tk.Frame(self.canvas, bg="white")
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
-
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        # Mouse wheel scrolling
-        self.canvas.bind_all(
-            "<MouseWheel>",
-            lambda e: self.canvas.yview_scroll(int(-1*(e.delta/120)), "units")
-        )
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Mouse wheel scrolling, only while the pointer is over the project list
+        # (the yscrollcommand refreshes the viewport)
+        self.canvas.bind("<Enter>", self._on_canvas_enter)
+        self.canvas.bind("<Leave>", self._on_canvas_leave)
+
+    def _on_canvas_enter(self, event):
+        """Route mouse wheel events to the project list"""
+        self.canvas.bind_all("<MouseWheel>", self._on_wheel)
+
+    def _on_canvas_leave(self, event):
+        """Stop routing mouse wheel events once the pointer leaves the list"""
+        # Moving onto a card (a child window) also sends <Leave> to the canvas
+        under = self.canvas.winfo_containing(event.x_root, event.y_root)
+        canvas_path = str(self.canvas)
+        under_path = str(under) if under is not None else ""
+        # Compare whole path components: '.!canvas2' is a sibling, not a child
+        if under_path != canvas_path and not under_path.startswith(canvas_path + "."):
+            self.canvas.unbind_all("<MouseWheel>")
+
+    def _on_wheel(self, event):
+        """Accumulate wheel deltas and scroll at most once per frame"""
+        self._wheel_delta += event.delta
+        if self._wheel_after is None:
+            self._wheel_after = self.canvas.after(16, self._flush_wheel)
+
+    def _flush_wheel(self):
+        """Scroll by the whole notches accumulated since the last frame"""
+        self._wheel_after = None
+        delta = self._wheel_delta
+        steps = abs(delta) // 120
+        if steps:
+            self.canvas.yview_scroll(-steps if delta > 0 else steps, "units")
+            self._wheel_delta = delta - 120 * steps if delta > 0 else delta + 120 * steps
 
     def _create_action_buttons(self, callbacks: Dict):
         """Create bottom action button bar"""
@@ -238,81 +295,37 @@ class MainWindowUI:
         button_inner.pack(expand=True)
 
         # Quick Run button
-        self.quick_run_button = tk.Button(
-            button_inner,
-            text="▶  Quick Run",
-            command=callbacks.get('quick_run'),
-            state=tk.DISABLED,
-            bg="#27ae60",
-            fg="white",
-            font=("Arial", 11, "bold"),
-            relief=tk.FLAT,
-            padx=25,
-            pady=10,
-            cursor="hand2"
+        self.quick_run_button = self._make_button(
+            button_inner, "▶  Quick Run", callbacks.get('quick_run'), "#27ae60",
+            font=("Arial", 11, "bold"), padx=25, state=tk.DISABLED
         )
         self.quick_run_button.pack(side=tk.LEFT, padx=5)
 
         # Create Launcher button
-        self.launcher_button = tk.Button(
-            button_inner,
-            text="📄 Create Launcher",
-            command=callbacks.get('create_launcher'),
-            state=tk.DISABLED,
-            bg="#3498db",
-            fg="white",
-            font=("Arial", 10),
-            relief=tk.FLAT,
-            padx=20,
-            pady=10,
-            cursor="hand2"
+        self.launcher_button = self._make_button(
+            button_inner, "📄 Create Launcher", callbacks.get('create_launcher'), "#3498db",
+            state=tk.DISABLED
         )
         self.launcher_button.pack(side=tk.LEFT, padx=5)
 
         # Advanced button
-        self.advanced_button = tk.Button(
-            button_inner,
-            text="⚙️ Advanced",
-            command=callbacks.get('advanced_mode'),
-            state=tk.DISABLED,
-            bg="#9b59b6",
-            fg="white",
-            font=("Arial", 10),
-            relief=tk.FLAT,
-            padx=20,
-            pady=10,
-            cursor="hand2"
+        self.advanced_button = self._make_button(
+            button_inner, "⚙️ Advanced", callbacks.get('advanced_mode'), "#9b59b6",
+            state=tk.DISABLED
         )
         self.advanced_button.pack(side=tk.LEFT, padx=5)
 
         # Inspect & Edit button
-        self.inspect_button = tk.Button(
-            button_inner,
-            text="🔍 Inspect & Edit",
-            command=callbacks.get('inspect_mode'),
-            state=tk.DISABLED,
-            bg="#e67e22",
-            fg="white",
-            font=("Arial", 10),
-            relief=tk.FLAT,
-            padx=20,
-            pady=10,
-            cursor="hand2"
+        self.inspect_button = self._make_button(
+            button_inner, "🔍 Inspect & Edit", callbacks.get('inspect_mode'), "#e67e22",
+            state=tk.DISABLED
         )
         self.inspect_button.pack(side=tk.LEFT, padx=5)
 
         # Help button
-        help_button = tk.Button(
-            button_inner,
-            text="❓ Help",
-            command=callbacks.get('show_help'),
-            bg="#95a5a6",
-            fg="white",
-            font=("Arial", 10),
-            relief=tk.FLAT,
-            padx=15,
-            pady=10,
-            cursor="hand2"
+        help_button = self._make_button(
+            button_inner, "❓ Help", callbacks.get('show_help'), "#95a5a6",
+            padx=15
         )
         help_button.pack(side=tk.LEFT, padx=15)
 
@@ -323,6 +336,44 @@ class MainWindowUI:
         ToolTip(self.inspect_button, "View and edit .mph file directly (no Comsol needed)")
         ToolTip(help_button, "Show help and documentation")
 
+    @classmethod
+    def _make_button(
+        cls,
+        parent,
+        text: str,
+        command: Callable,
+        bg: str,
+        font=_ACTION_FONT,
+        padx: int = 20,
+        state: str = tk.NORMAL
+    ) -> tk.Button:
+        """
+        Create an action bar button with the shared flat style.
+
+        Args:
+            parent: Parent widget
+            text: Button label
+            command: Click callback
+            bg: Background color
+            font: Font tuple
+            padx: Horizontal padding
+            state: Initial state
+
+        Returns:
+            The new (unpacked) button
+        """
+        return tk.Button(
+            parent,
+            text=text,
+            command=command,
+            bg=bg,
+            font=font,
+            padx=padx,
+            pady=10,
+            state=state,
+            **cls._BUTTON_BASE
+        )
+
     def enable_action_buttons(self):
         """Enable all action buttons (called when project is selected)"""
         self.quick_run_button.config(state=tk.NORMAL)
@@ -330,6 +381,23 @@ class MainWindowUI:
         self.advanced_button.config(state=tk.NORMAL)
         self.inspect_button.config(state=tk.NORMAL)
 
+    def set_install_busy(self, job: str, busy: bool):
+        """
+        Show whether an install job is running on its status-bar button.
+
+        Args:
+            job: Job id ("uv" or "mph")
+            busy: True while the job runs in the background
+        """
+        button = self.install_buttons.get(job)
+        if button is None:
+            return
+        label = "UV" if job == "uv" else "mph"
+        button.config(
+            text=f"Installing {label}…" if busy else f"Install {label}",
+            state=tk.DISABLED if busy else tk.NORMAL
+        )
+
     def disable_action_buttons(self):
         """Disable all action buttons"""
         self.quick_run_button.config(state=tk.DISABLED)
@@ -2,34 +2,198 @@
 Project card UI components for displaying .mph files
 """
 import tkinter as tk
-from typing import Dict, Callable, Optional
+from typing import Dict, Callable, Iterable, List, Optional, Tuple
+
+from .fonts import shared_font
+
+
+# Smallest height of one card row on the canvas, in pixels; larger font
+# scaling (high DPI) grows rows to fit, see card_row_height()
+MIN_ROW_HEIGHT = 90
+# Vertical gap between cards and horizontal inset from the canvas edges
+CARD_PADY = 5
+CARD_PADX = 10
+# Padding inside the card border, and what a tk.Label adds around its text
+# (pady plus border, both sides)
+CARD_INNER_PADY = 12
+_LABEL_PAD = 2 * (1 + 2)
+# Bind tag shared by every widget on a card
+CARD_BINDTAG = "ProjectCard"
+
+
+def card_row_height() -> int:
+    """
+    Height of one card row for the current Tk scaling.
+
+    Cards have a fixed size on the canvas, so the row must be tall enough
+    for the icon or the two text lines at the scaled font sizes. Requires
+    an existing Tk root.
+
+    Returns:
+        Row height in pixels, at least MIN_ROW_HEIGHT
+    """
+    text = (
+        shared_font("Arial", 12, "bold").metrics('linespace')
+        + 2  # gap between name and file name
+        + shared_font("Arial", 9).metrics('linespace')
+        + 2 * _LABEL_PAD
+    )
+    icon = shared_font("Arial", 32).metrics('linespace') + _LABEL_PAD
+    content = max(text, icon) + 2 * CARD_INNER_PADY + 2  # 1 px card border
+    return max(MIN_ROW_HEIGHT, content + 2 * CARD_PADY)
+
+
+class _CardWidget:
+    """A reusable card: one frame plus the labels rebound to each project"""
+
+    def __init__(self, canvas: tk.Canvas, width: int, row_height: int):
+        """
+        Build the card widgets and place them on the canvas (hidden).
+
+        Args:
+            canvas: Canvas the card is drawn on
+            width: Card width in pixels
+            row_height: Height of a card row, including the gap
+        """
+        self.project_name: Optional[str] = None
+        self.selected = False
+
+        self.frame = tk.Frame(
+            canvas,
+            bg="white",
+            relief=tk.SOLID,
+            borderwidth=1,
+            cursor="hand2"
+        )
+        # The canvas window fixes the card size, so relabelling a pooled
+        # card must not send geometry requests back up to the canvas
+        self.frame.pack_propagate(False)
+
+        # Inner padding frame
+        inner = tk.Frame(self.frame, bg="white")
+        inner.pack(fill=tk.BOTH, expand=True, padx=15, pady=CARD_INNER_PADY)
+
+        # Left side - Icon and name
+        left_frame = tk.Frame(inner, bg="white")
+        left_frame.pack(side=tk.LEFT, fill=tk.Y)
+
+        icon = tk.Label(
+            left_frame,
+            text="📊",
+            font=shared_font("Arial", 32),
+            bg="white"
+        )
+        icon.pack(side=tk.LEFT, padx=(0, 15))
+
+        info_frame = tk.Frame(left_frame, bg="white")
+        info_frame.pack(side=tk.LEFT, fill=tk.Y)
+
+        self.name_label = tk.Label(
+            info_frame,
+            font=shared_font("Arial", 12, "bold"),
+            bg="white",
+            fg="#2c3e50",
+            anchor=tk.W
+        )
+        self.name_label.pack(anchor=tk.W)
+
+        self.file_label = tk.Label(
+            info_frame,
+            font=shared_font("Arial", 9),
+            bg="white",
+            fg="#7f8c8d",
+            anchor=tk.W
+        )
+        self.file_label.pack(anchor=tk.W, pady=(2, 0))
+
+        # Right side - Metadata
+        right_frame = tk.Frame(inner, bg="white")
+        right_frame.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.meta_label = tk.Label(
+            right_frame,
+            font=shared_font("Arial", 9),
+            bg="white",
+            fg="#95a5a6"
+        )
+        self.meta_label.pack(side=tk.RIGHT)
+
+        # Every widget whose background follows the selection, collected
+        # once so repainting needs no widget-tree traversal
+        self.bg_widgets: List[tk.Widget] = []
+        stack = [self.frame]
+        while stack:
+            widget = stack.pop()
+            self.bg_widgets.append(widget)
+            stack.extend(widget.winfo_children())
+
+        # Clicks anywhere on the card reach the one class binding for the tag
+        for widget in self.bg_widgets:
+            widget.bindtags(widget.bindtags() + (CARD_BINDTAG,))
+
+        self.window_id = canvas.create_window(
+            CARD_PADX, 0,
+            window=self.frame,
+            anchor="nw",
+            width=width,
+            height=row_height - 2 * CARD_PADY,
+            state="hidden"
+        )
 
 
 class ProjectCardManager:
     """
     Manages project card widgets for displaying .mph files.
     Cards show project name, file size, modification date, and support selection.
+
+    Only the cards intersecting the canvas viewport exist as widgets; a small
+    pool of cards is rebound to other projects as the list scrolls.
     """
 
-    def __init__(self, scrollable_frame, on_select_callback: Callable):
+    def __init__(self, canvas: tk.Canvas, scrollbar, on_select_callback: Callable):
         """
         Initialize project card manager.
 
         Args:
-            scrollable_frame: Parent frame for project cards
-            on_select_callback: Function to call when project is selected
+            canvas: Canvas the project cards are drawn on
+            scrollbar: Scrollbar attached to the canvas
+            on_select_callback: Function called with (project_name, project_info)
+                when a project is selected
         """
-        self.scrollable_frame = scrollable_frame
+        self.canvas = canvas
+        self.scrollbar = scrollbar
         self.on_select_callback = on_select_callback
-        self.project_frames = {}
+        self.project_infos = {}
         self.selected_project = None
 
+        # Project names in display order (metadata only, no widgets)
+        self._projects: List[str] = []
+        # Cards currently on screen keyed by row index, and idle cards
+        self._visible: Dict[int, _CardWidget] = {}
+        self._pool: List[_CardWidget] = []
+        self._canvas_width = 1
+        self._card_width = 1
+        # Measured once; font scaling does not change while the app runs
+        self._row_height = card_row_height()
+        self._refresh_pending = False
+        self._empty_frame = None
+        self._empty_window = None
+
+        # Widget path -> card, for the single shared click binding
+        self._card_by_widget: Dict[str, _CardWidget] = {}
+        canvas.bind_class(CARD_BINDTAG, "<Button-1>", self._on_card_click)
+
+        canvas.configure(yscrollcommand=self._on_yscroll)
+        canvas.bind("<Configure>", self._on_configure)
+
     def clear(self):
-        """Clear all project cards"""
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        self.project_frames = {}
+        """Clear all project cards (cards return to the pool, not destroyed)"""
+        self.hide_empty_state()
+        self._projects = []
+        self.project_infos = {}
         self.selected_project = None
+        self._release_all()
+        self._update_scrollregion()
 
     def show_empty_state(self, message: str):
         """
@@ -38,8 +202,8 @@ class ProjectCardManager:
         Args:
             message: Message to display
         """
-        empty_frame = tk.Frame(self.scrollable_frame, bg="white")
-        empty_frame.pack(fill=tk.BOTH, expand=True, pady=50)
+        self.hide_empty_state()
+        empty_frame = tk.Frame(self.canvas, bg="white")
 
         tk.Label(
             empty_frame,
@@ -57,101 +221,193 @@ class ProjectCardManager:
             fg="#7f8c8d"
         ).pack(pady=10)
 
-    def create_card(self, project_name: str, project_info: Dict):
-        """
-        Create a visual card for a project.
-
-        Args:
-            project_name: Unique identifier for project
-            project_info: Dictionary with project metadata
-        """
-        # Card container
-        card = tk.Frame(
-            self.scrollable_frame,
-            bg="white",
-            relief=tk.SOLID,
-            borderwidth=1,
-            cursor="hand2"
+        self._empty_frame = empty_frame
+        self._empty_window = self.canvas.create_window(
+            self._canvas_width // 2, 50,
+            window=empty_frame,
+            anchor="n"
         )
-        card.pack(fill=tk.X, padx=10, pady=5)
-
-        # Store reference
-        self.project_frames[project_name] = card
 
-        # Bind click events
-        card.bind("<Button-1>", lambda e: self.select_project(project_name))
+    def hide_empty_state(self):
+        """Remove the empty-state placeholder, keeping project cards"""
+        if self._empty_frame is not None:
+            self.canvas.delete(self._empty_window)
+            self._empty_frame.destroy()
+            self._empty_frame = None
+            self._empty_window = None
 
-        # Inner padding frame
-        inner = tk.Frame(card, bg="white")
-        inner.pack(fill=tk.BOTH, expand=True, padx=15, pady=12)
-
-        # Left side - Icon and name
-        self._create_left_side(inner, project_info, project_name)
-
-        # Right side - Metadata
-        self._create_right_side(inner, project_info, project_name)
-
-    def _create_left_side(self, parent, project_info: Dict, project_name: str):
-        """Create left side of card with icon and name"""
-        left_frame = tk.Frame(parent, bg="white")
-        left_frame.pack(side=tk.LEFT, fill=tk.Y)
-
-        # Icon
-        tk.Label(
-            left_frame,
-            text="📊",
-            font=("Arial", 32),
-            bg="white"
-        ).pack(side=tk.LEFT, padx=(0, 15))
-
-        # Project name and details
-        info_frame = tk.Frame(left_frame, bg="white")
-        info_frame.pack(side=tk.LEFT, fill=tk.Y)
+    def create_cards_batch(self, items: Iterable[Tuple[str, Dict]]):
+        """
+        Replace the card list with many projects at once.
 
-        tk.Label(
-            info_frame,
-            text=project_info['display_name'],
-            font=("Arial", 12, "bold"),
-            bg="white",
-            fg="#2c3e50",
-            anchor=tk.W
-        ).pack(anchor=tk.W)
+        Only the rows in view are materialized, so the cost does not grow
+        with the number of projects.
 
-        tk.Label(
-            info_frame,
-            text=f"{project_info['file_path'].name}",
-            font=("Arial", 9),
-            bg="white",
-            fg="#7f8c8d",
-            anchor=tk.W
-        ).pack(anchor=tk.W, pady=(2, 0))
+        Args:
+            items: Iterable of (project_name, project_info) pairs
+        """
+        self.project_infos = dict(items)
+        self._projects = list(self.project_infos)
+        if self.selected_project not in self.project_infos:
+            self.selected_project = None
+        self._release_all()
+        self._update_scrollregion()
+        self._refresh_viewport()
+
+    def update(self, projects: Dict[str, Dict]):
+        """
+        Bring the card list in line with a new scan result.
 
-        # Bind click events to all widgets
-        for widget in [left_frame, info_frame]:
-            widget.bind("<Button-1>", lambda e: self.select_project(project_name))
-            for child in widget.winfo_children():
-                child.bind("<Button-1>", lambda e: self.select_project(project_name))
+        If the same projects are listed in the same order, only cards whose
+        file changed are relabelled; otherwise the visible rows are rebound
+        once to the new list. Cards are never rebuilt.
 
-    def _create_right_side(self, parent, project_info: Dict, project_name: str):
-        """Create right side of card with metadata"""
-        right_frame = tk.Frame(parent, bg="white")
-        right_frame.pack(side=tk.RIGHT, fill=tk.Y)
+        Args:
+            projects: Dictionary mapping project names to project metadata,
+                in display order
+        """
+        old_infos = self.project_infos
+        names = list(projects)
+
+        if names == self._projects:
+            for project_name, project_info in projects.items():
+                old_info = old_infos[project_name]
+                if (old_info['size_bytes'], old_info['modified']) != (
+                    project_info['size_bytes'], project_info['modified']
+                ):
+                    self.update_card(project_name, project_info)
+            self.project_infos = dict(projects)
+            return
+
+        self.project_infos = dict(projects)
+        self._projects = names
+        if self.selected_project not in self.project_infos:
+            self.selected_project = None
+        self._release_all()
+        self._schedule_refresh()
+
+    def update_card(self, project_name: str, project_info: Dict):
+        """
+        Refresh a card's metadata text in place after the file changed.
 
-        metadata_text = (
-            f"{project_info['size_str']}  •  {project_info['modified_str']}"
-        )
-        label = tk.Label(
-            right_frame,
-            text=metadata_text,
-            font=("Arial", 9),
-            bg="white",
-            fg="#95a5a6"
+        Args:
+            project_name: Name of project to update
+            project_info: Dictionary with new project metadata
+        """
+        if project_name not in self.project_infos:
+            return
+        self.project_infos[project_name] = project_info
+        for card in self._visible.values():
+            if card.project_name == project_name:
+                card.meta_label.configure(text=self._metadata_text(project_info))
+
+    @staticmethod
+    def _metadata_text(project_info: Dict) -> str:
+        """Build the size/date text shown on the right of a card"""
+        return f"{project_info['size_str']}  •  {project_info['modified_str']}"
+
+    def _schedule_refresh(self):
+        """Coalesce several resizes or list changes into one viewport refresh"""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.canvas.after_idle(self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self):
+        """Apply resizes and list changes queued by _schedule_refresh"""
+        self._refresh_pending = False
+        self._apply_width()
+        self._update_scrollregion()
+        self._refresh_viewport()
+
+    def _update_scrollregion(self):
+        """Size the scroll region to the full list of rows"""
+        self.canvas.configure(scrollregion=(
+            0, 0, self._canvas_width, len(self._projects) * self._row_height
+        ))
+
+    def _refresh_viewport(self):
+        """Bind pooled cards to the rows intersecting the viewport"""
+        row_height = self._row_height
+        first = int(self.canvas.canvasy(0) // row_height)
+        last = min(
+            first + int(self.canvas.winfo_height() // row_height) + 1,
+            len(self._projects) - 1
         )
-        label.pack(side=tk.RIGHT)
 
-        # Bind click events
-        right_frame.bind("<Button-1>", lambda e: self.select_project(project_name))
-        label.bind("<Button-1>", lambda e: self.select_project(project_name))
+        # Return cards that scrolled out of view to the pool
+        for index in [i for i in self._visible if i < first or i > last]:
+            self._release(self._visible.pop(index))
+
+        for index in range(first, last + 1):
+            if index in self._visible:
+                continue
+            card = self._pool.pop() if self._pool else self._new_card()
+            self._bind_card(card, self._projects[index])
+            self.canvas.coords(card.window_id, CARD_PADX, index * row_height + CARD_PADY)
+            self.canvas.itemconfigure(card.window_id, state="normal")
+            self._visible[index] = card
+
+    def _bind_card(self, card: _CardWidget, project_name: str):
+        """Show a project's details on a pooled card"""
+        project_info = self.project_infos[project_name]
+        card.project_name = project_name
+        card.name_label.configure(text=project_info['display_name'])
+        card.file_label.configure(text=project_info['file_name'])
+        card.meta_label.configure(text=self._metadata_text(project_info))
+        self._paint(card, project_name == self.selected_project)
+
+    def _release(self, card: _CardWidget):
+        """Hide a card and return it to the pool"""
+        self.canvas.itemconfigure(card.window_id, state="hidden")
+        card.project_name = None
+        self._pool.append(card)
+
+    def _release_all(self):
+        """Return every visible card to the pool"""
+        for card in self._visible.values():
+            self._release(card)
+        self._visible = {}
+
+    def _on_yscroll(self, first, last):
+        """Update the scrollbar and rebind cards to the new viewport"""
+        self.scrollbar.set(first, last)
+        self._refresh_viewport()
+
+    def _on_configure(self, event):
+        """Note the new canvas width; resizes are applied once per idle cycle"""
+        self._canvas_width = event.width
+        self._schedule_refresh()
+
+    def _apply_width(self):
+        """Stretch cards and the empty-state placeholder to the canvas width"""
+        card_width = max(self._canvas_width - 2 * CARD_PADX, 1)
+        if card_width == self._card_width:
+            return
+        self._card_width = card_width
+        for card in (*self._visible.values(), *self._pool):
+            self.canvas.itemconfigure(card.window_id, width=card_width)
+        if self._empty_window is not None:
+            self.canvas.coords(self._empty_window, self._canvas_width // 2, 50)
+
+    def _new_card(self) -> _CardWidget:
+        """Build a pooled card and register its widgets for click lookup"""
+        card = _CardWidget(self.canvas, self._card_width, self._row_height)
+        for widget in card.bg_widgets:
+            self._card_by_widget[str(widget)] = card
+        return card
+
+    def _on_card_click(self, event):
+        """Select the project shown on the card that was clicked"""
+        card = self._card_by_widget.get(str(event.widget))
+        if card is not None and card.project_name is not None:
+            self.select_project(card.project_name)
+
+    def _card_for(self, project_name: Optional[str]) -> Optional[_CardWidget]:
+        """Return the visible card showing a project, if any"""
+        for card in self._visible.values():
+            if card.project_name == project_name:
+                return card
+        return None
 
     def select_project(self, project_name: str):
         """
@@ -161,34 +417,38 @@ class ProjectCardManager:
             project_name: Name of project to select
         """
         # Deselect previous
-        if self.selected_project and self.selected_project in self.project_frames:
-            old_card = self.project_frames[self.selected_project]
-            old_card.configure(bg="white", borderwidth=1)
-            self._set_widget_bg(old_card, "white")
+        old_card = self._card_for(self.selected_project)
+        if old_card is not None:
+            self._paint(old_card, False)
 
         # Select new
         self.selected_project = project_name
-        card = self.project_frames[project_name]
-        card.configure(bg="#ebf5fb", borderwidth=2)
-        self._set_widget_bg(card, "#ebf5fb")
+        card = self._card_for(project_name)
+        if card is not None:
+            self._paint(card, True)
 
         # Notify callback
-        self.on_select_callback(project_name)
-
-    def _set_widget_bg(self, widget, color: str):
+        self.on_select_callback(project_name, self.project_infos[project_name])
+
+    def _paint(self, card: _CardWidget, selected: bool):
+        """Apply the selected or unselected look to a card"""
+        if card.selected == selected:
+            return
+        card.selected = selected
+        card.frame.configure(borderwidth=2 if selected else 1)
+        self._set_widget_bg(card, "#ebf5fb" if selected else "white")
+
+    @staticmethod
+    def _set_widget_bg(card: _CardWidget, color: str):
         """
-        Recursively set background color of widget and all children.
+        Set background color of every widget on a card.
 
         Args:
-            widget: Widget to update
+            card: Card to update
             color: Background color
         """
-        try:
+        for widget in card.bg_widgets:
             widget.configure(bg=color)
-        except:
-            pass
-        for child in widget.winfo_children():
-            self._set_widget_bg(child, color)
 
     def get_selected_project(self) -> Optional[str]:
         """
@@ -0,0 +1,28 @@
+"""
+Named ttk styles shared by all widgets that use them
+"""
+from tkinter import ttk
+from typing import Dict
+
+# Style names already configured in this process
+_registered = set()
+
+
+def register_styles(styles: Dict[str, Dict]):
+    """
+    Configure named ttk styles once per process.
+
+    Widgets then reference a style by name instead of each carrying its
+    own colors and fonts. Requires an existing Tk root.
+
+    Args:
+        styles: Mapping of style name (e.g. "Apply.TButton") to configure() options
+    """
+    new_names = [name for name in styles if name not in _registered]
+    if not new_names:
+        return
+
+    style = ttk.Style()
+    for name in new_names:
+        style.configure(name, **styles[name])
+        _registered.add(name)
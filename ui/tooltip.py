@@ -2,17 +2,27 @@
 ToolTip widget for displaying hover help text
 """
 import tkinter as tk
+from typing import Optional
 
 
 class ToolTip:
     """
     Simple tooltip widget for showing help text on hover.
 
+    The tooltip appears after a short hover delay, and all tooltips share
+    one hidden Toplevel that is repositioned instead of recreated.
+
     Usage:
         button = tk.Button(root, text="Click me")
         ToolTip(button, "This is a helpful tooltip")
     """
 
+    # Hover time before the tooltip appears, in milliseconds
+    DELAY_MS = 400
+
+    _shared_tip: Optional[tk.Toplevel] = None
+    _shared_label: Optional[tk.Label] = None
+
     def __init__(self, widget, text):
         """
         Initialize tooltip for a widget.
@@ -23,36 +33,67 @@ class ToolTip:
         """
         self.widget = widget
         self.text = text
-        self.tooltip = None
+        self._after_id = None
         self.widget.bind("<Enter>", self.show)
         self.widget.bind("<Leave>", self.hide)
 
     def show(self, event=None):
-        """Show the tooltip near the widget"""
+        """Schedule the tooltip to appear if the pointer stays on the widget"""
+        if self._after_id is None:
+            self._after_id = self.widget.after(self.DELAY_MS, self._really_show)
+
+    def _really_show(self):
+        """Show the shared tooltip near the widget"""
+        self._after_id = None
+        tip, label = self._get_shared_tip(self.widget)
+
         # Position tooltip below and to the right of widget
         x = self.widget.winfo_rootx() + 20
         y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
 
-        self.tooltip = tk.Toplevel(self.widget)
-        self.tooltip.wm_overrideredirect(True)
-        self.tooltip.wm_geometry(f"+{x}+{y}")
-
-        label = tk.Label(
-            self.tooltip,
-            text=self.text,
-            justify=tk.LEFT,
-            background="#34495e",
-            foreground="white",
-            relief=tk.SOLID,
-            borderwidth=1,
-            font=("Arial", 9),
-            padx=8,
-            pady=5
-        )
-        label.pack()
+        label.configure(text=self.text)
+        tip.wm_geometry(f"+{x}+{y}")
+        tip.deiconify()
+        tip.lift()
 
     def hide(self, event=None):
-        """Hide the tooltip"""
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        """Cancel a pending tooltip and hide the visible one"""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        tip = ToolTip._shared_tip
+        if tip is not None and tip.winfo_exists():
+            tip.withdraw()
+
+    @classmethod
+    def _get_shared_tip(cls, widget):
+        """
+        Return the shared tooltip window, building it on first use.
+
+        Args:
+            widget: Any widget of the application (its root owns the tooltip)
+
+        Returns:
+            Tuple of (Toplevel, Label)
+        """
+        if cls._shared_tip is None or not cls._shared_tip.winfo_exists():
+            tip = tk.Toplevel(widget._root())
+            tip.withdraw()
+            tip.wm_overrideredirect(True)
+
+            label = tk.Label(
+                tip,
+                justify=tk.LEFT,
+                background="#34495e",
+                foreground="white",
+                relief=tk.SOLID,
+                borderwidth=1,
+                font=("Arial", 9),
+                padx=8,
+                pady=5
+            )
+            label.pack()
+
+            cls._shared_tip = tip
+            cls._shared_label = label
+        return cls._shared_tip, cls._shared_label
@@ -0,0 +1,87 @@
+"""
+Treeview helpers for inserting many rows with few Tcl round-trips
+"""
+from typing import Sequence, Tuple
+
+# Tcl lambda that inserts every (text, values, tags) row in one interpreter call
+_INSERT_ROWS = (
+    '{w rows} {foreach row $rows {'
+    'lassign $row text values tags; '
+    '$w insert {} end -text $text -values $values -tags $tags'
+    '}}'
+)
+
+
+def insert_rows(tree, rows: Sequence[Tuple[str, Tuple, Tuple]]):
+    """
+    Append rows to a ttk.Treeview using a single Tcl call.
+
+    Args:
+        tree: ttk.Treeview to insert into
+        rows: Sequence of (text, values, tags) tuples
+    """
+    if rows:
+        tree.tk.call('apply', _INSERT_ROWS, str(tree), tuple(rows))
+
+
+class LazyRows:
+    """
+    Feeds rows into a ttk.Treeview a page at a time.
+
+    Only the first page is inserted up front; the next page is inserted
+    whenever the view scrolls near the last inserted row. Installs itself
+    as the tree's yscrollcommand and forwards to the scrollbar.
+    """
+
+    def __init__(self, tree, scrollbar, page_size: int = 200):
+        """
+        Args:
+            tree: ttk.Treeview to fill
+            scrollbar: Scrollbar attached to the tree
+            page_size: Rows inserted per page
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.page_size = page_size
+        self._rows = []
+        self._next = 0
+        tree.configure(yscrollcommand=self._on_yscroll)
+
+    def set_rows(self, rows: Sequence[Tuple[str, Tuple, Tuple]]):
+        """
+        Queue rows for insertion and insert the first page.
+
+        Args:
+            rows: Sequence of (text, values, tags) tuples
+        """
+        self._rows = []
+        self._next = 0
+        self.add_rows(rows)
+
+    def add_rows(self, rows: Sequence[Tuple[str, Tuple, Tuple]]):
+        """
+        Queue more rows, inserting a page now if the first page is not
+        full yet or the view is already at the end of the tree.
+
+        Args:
+            rows: Sequence of (text, values, tags) tuples
+        """
+        self._rows.extend(rows)
+        if self._next < self.page_size or self.tree.yview()[1] >= 0.9:
+            self._insert_page()
+
+    def pending(self) -> Sequence[Tuple[str, Tuple, Tuple]]:
+        """Return rows not yet inserted into the tree"""
+        return self._rows[self._next:]
+
+    def _insert_page(self):
+        """Insert the next page of rows"""
+        end = self._next + self.page_size
+        insert_rows(self.tree, self._rows[self._next:end])
+        self._next = min(end, len(self._rows))
+
+    def _on_yscroll(self, first, last):
+        """Update the scrollbar and extend the tree when nearing its end"""
+        self.scrollbar.set(first, last)
+        if self._next < len(self._rows) and float(last) >= 0.9:
+            self._insert_page()
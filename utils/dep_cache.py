@@ -0,0 +1,108 @@
+"""
+Cached dependency probing (mph, UV, Java, numpy)
+"""
+import json
+import os
+import shutil
+import sys
+import sysconfig
+import importlib.util
+from functools import lru_cache
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from .dependency_manager import DependencyManager
+
+
+CACHE_FILE = Path.home() / ".cache" / "comsol_launcher" / "deps.json"
+
+
+class DepStatus(NamedTuple):
+    """Availability of the external dependencies"""
+    mph: bool
+    uv: bool
+    java: bool
+    numpy: bool
+
+
+def _mtime(path: Optional[str]) -> Optional[float]:
+    """Return modification time of path, or None if it cannot be stat'ed"""
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _cache_key() -> List:
+    """
+    Build the key that invalidates the cache.
+
+    The interpreter and its site-packages mtimes change when Python is
+    replaced or packages are installed; the uv/java paths change when
+    those tools are installed or removed.
+    """
+    purelib = sysconfig.get_paths().get('purelib')
+    return [
+        sys.executable,
+        _mtime(sys.executable),
+        purelib,
+        _mtime(purelib),
+        shutil.which('uv'),
+        shutil.which('java')
+    ]
+
+
+def _load(key: List) -> Optional[DepStatus]:
+    """Load cached status if its key matches"""
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get('key') == key:
+            return DepStatus(**data['status'])
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+    return None
+
+
+def _save(key: List, status: DepStatus):
+    """Persist status; failures are ignored since the cache is optional"""
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({'key': key, 'status': status._asdict()}, f)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=1)
+def probe() -> DepStatus:
+    """
+    Probe dependencies once per process, reusing the on-disk result when
+    the interpreter, site-packages and tool paths are unchanged.
+
+    Returns:
+        DepStatus with availability of each dependency
+    """
+    key = _cache_key()
+    status = _load(key)
+    if status is None:
+        status = DepStatus(
+            mph=DependencyManager.check_mph_available(),
+            uv=DependencyManager.check_uv_available(),
+            java=shutil.which('java') is not None,
+            numpy=importlib.util.find_spec('numpy') is not None
+        )
+        _save(key, status)
+    return status
+
+
+def invalidate():
+    """Forget cached results (call after installing dependencies)"""
+    probe.cache_clear()
+    DependencyManager.clear_cache()
+    try:
+        CACHE_FILE.unlink()
+    except OSError:
+        pass
@@ -1,10 +1,16 @@
 """
 Dependency management utilities (UV, pip, mph library)
 """
+import importlib.util
+import shutil
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+# Keep probe subprocesses from allocating a console window on Windows
+_NO_WINDOW = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+
 
 class DependencyManager:
     """
@@ -12,37 +18,53 @@ class DependencyManager:
     """
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def check_mph_available() -> bool:
         """
         Check if mph library is installed and importable.
 
+        Locates the package without importing it, so JPype is not loaded.
+        The result is cached per process; installing mph clears it.
+
         Returns:
             True if mph is available, False otherwise
         """
-        try:
-            import mph
-            return True
-        except ImportError:
-            return False
+        return importlib.util.find_spec("mph") is not None
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def check_uv_available() -> bool:
         """
         Check if UV package manager is installed.
 
+        The result is cached per process; installing UV clears it.
+
         Returns:
             True if UV is available, False otherwise
         """
+        uv_path = shutil.which("uv")
+        if uv_path is None:
+            return False
         try:
             result = subprocess.run(
-                ["uv", "--version"],
-                capture_output=True,
-                text=True
+                [uv_path, "--version"],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=_NO_WINDOW
             )
             return result.returncode == 0
-        except FileNotFoundError:
+        except OSError:
             return False
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget cached availability checks (call after installing)"""
+        DependencyManager.check_mph_available.cache_clear()
+        DependencyManager.check_uv_available.cache_clear()
+        # Let find_spec see packages installed since startup
+        importlib.invalidate_caches()
+
     @staticmethod
     def setup_uv_environment(base_path: Path) -> None:
         """
@@ -68,6 +90,7 @@ class DependencyManager:
             cwd=base_path,
             check=True
         )
+        DependencyManager.clear_cache()
 
     @staticmethod
     def install_mph_with_pip() -> bool:
@@ -81,8 +104,10 @@ class DependencyManager:
             subprocess.run(
                 [sys.executable, "-m", "pip", "install", "mph", "numpy"],
                 check=True,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
+            DependencyManager.clear_cache()
             return True
         except subprocess.CalledProcessError:
             return False
@@ -99,8 +124,10 @@ class DependencyManager:
             subprocess.run(
                 [sys.executable, "-m", "pip", "install", "uv"],
                 check=True,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
+            DependencyManager.clear_cache()
             return True
         except subprocess.CalledProcessError:
             return False
@@ -0,0 +1,42 @@
+"""
+Shared mph client (one Comsol session per process)
+"""
+import threading
+
+_client = None
+_lock = threading.Lock()
+
+
+def get_client():
+    """
+    Return the process-wide mph client, starting it on first use.
+
+    mph.start() boots a Java VM and connects to Comsol, which takes
+    seconds and can only happen once per process, so every feature
+    shares the same client.
+
+    Returns:
+        mph.Client instance
+
+    Raises:
+        ImportError: If mph is not installed
+        Exception: Whatever mph.start() raises when Comsol is unavailable
+    """
+    global _client
+    with _lock:
+        if _client is None:
+            import mph
+            _client = mph.start()
+        return _client
+
+
+def shutdown():
+    """Disconnect the shared client if one was started"""
+    global _client
+    with _lock:
+        client, _client = _client, None
+    if client is not None:
+        try:
+            client.disconnect()
+        except Exception:
+            pass  # Stand-alone clients end with the process anyway
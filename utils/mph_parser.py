@@ -1,11 +1,220 @@
 """
 MPH file parsing utilities
 """
+import os
 import re
 import zipfile
 import xml.etree.ElementTree as ET
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, NamedTuple, Tuple, Optional, Union
+from xml.sax.saxutils import unescape
+
+
+# Fallback for dmodel.xml files that are not well-formed XML.
+# Matches: <expressions name="param_name" expr="value" descr="description"...
+PARAM_RE = re.compile(
+    rb'<expressions[^>]*name="([^"]*)"[^>]*expr="([^"]*)"[^>]*descr="([^"]*)"'
+)
+
+# Archive member suffix -> (file_type_label, color_tag)
+_SUFFIX_MAP = {
+    '.xml': ("Configuration", 'xml'),
+    '.json': ("Metadata", 'json'),
+    '.mphbin': ("Simulation Data", 'binary'),
+    '.png': ("Preview Image", 'image'),
+    '.txt': ("Text Data", 'text'),
+    '.zip': ("Checkpoint", 'archive'),
+}
+_DEFAULT_CLASS = ("Data", 'text')
+
+# Suffixes counted as binary / text in the model info size breakdown
+BINARY_SUFFIX = '.mphbin'
+TEXT_SUFFIXES = ('.xml', '.json', '.txt')
+
+
+class MphArchive:
+    """
+    An open .mph archive shared by several reads.
+
+    Opening the zip parses its central directory once; the file list,
+    parameters and model info are then read from the same handle.
+    Use via MphParser.open() as a context manager.
+    """
+
+    def __init__(self, mph_path: Path):
+        """
+        Open the archive.
+
+        Args:
+            mph_path: Path to .mph file
+        """
+        self.zf = zipfile.ZipFile(mph_path, 'r')
+        self.infolist = self.zf.infolist()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying zip file"""
+        self.zf.close()
+
+    def file_list(self) -> List[Dict[str, str]]:
+        """
+        List files inside the archive.
+
+        Returns:
+            List of dictionaries with file information
+        """
+        return list(self.iter_file_list())
+
+    def iter_file_list(self) -> Iterator[Dict[str, str]]:
+        """
+        Yield file information for each archive member in order.
+
+        Yields:
+            Dictionary with file information
+        """
+        for file_info in self.infolist:
+            size_kb = file_info.file_size / 1024
+            if size_kb < 1:
+                size_str = f"{file_info.file_size} B"
+            else:
+                size_str = f"{size_kb:.1f} KB"
+
+            # Determine type and color tag
+            file_type, tag = MphParser._classify_file(file_info.filename)
+
+            yield {
+                'filename': file_info.filename,
+                'size': size_str,
+                'type': file_type,
+                'tag': tag
+            }
+
+    def parameters(self) -> List[Tuple[str, str, str]]:
+        """
+        Load parameters from dmodel.xml.
+
+        The XML is stream-parsed straight from the zip entry, so the
+        (often multi-megabyte) file is never held in memory as a string.
+
+        Returns:
+            List of tuples (name, value, description)
+        """
+        try:
+            parameters = []
+            with self.zf.open('dmodel.xml') as f:
+                for _, elem in ET.iterparse(f, events=('end',)):
+                    if elem.tag.endswith('expressions'):
+                        name = elem.get('name')
+                        value = elem.get('expr')
+                        desc = elem.get('descr')
+                        if (desc is not None and name is not None and value is not None
+                                and MphParser._keep_parameter(name, value)):
+                            parameters.append((name, value, desc))
+                    # Children have already been seen, free them
+                    elem.clear()
+            return parameters
+        except ET.ParseError:
+            return MphParser.parse_parameters(self.zf.read('dmodel.xml'))
+        except Exception:
+            return []
+
+    def _modelinfo_root(self) -> ET.Element:
+        """
+        Pull-parse modelinfo.xml until its root element starts.
+
+        Returns:
+            Root element (attributes only; children are not parsed)
+
+        Raises:
+            ET.ParseError: If the file ends before a root element
+        """
+        parser = ET.XMLPullParser(events=('start',))
+        with self.zf.open('modelinfo.xml') as f:
+            while True:
+                chunk = f.read(4096)
+                if not chunk:
+                    parser.close()
+                    raise ET.ParseError("no root element in modelinfo.xml")
+                parser.feed(chunk)
+                for _, elem in parser.read_events():
+                    return elem
+
+    def model_info(self) -> Optional[Dict[str, str]]:
+        """
+        Load model information.
+
+        Returns:
+            Dictionary with model info or None if loading fails
+        """
+        try:
+            # Read version
+            fileversion = self.zf.read('fileversion').decode('utf-8', errors='ignore').strip()
+
+            # Read title/description from the root start tag only
+            root = self._modelinfo_root()
+            title = root.get('title', 'N/A')
+            description = root.get('description', 'N/A')
+
+            # Calculate sizes in one pass, classifying each member once
+            # (binary members dominate archive mass, so they are tested first)
+            total_size = text_size = binary_size = 0
+            for f in self.infolist:
+                size = f.file_size
+                total_size += size
+                name = f.filename
+                if name.endswith(BINARY_SUFFIX):
+                    binary_size += size
+                elif name.endswith(TEXT_SUFFIXES):
+                    text_size += size
+
+            return {
+                'version': fileversion,
+                'title': title,
+                'description': description,
+                'file_count': len(self.infolist),
+                'total_size_mb': total_size / 1024 / 1024,
+                'text_size_mb': text_size / 1024 / 1024,
+                'binary_size_mb': binary_size / 1024 / 1024,
+                'text_percent': text_size / total_size * 100 if total_size > 0 else 0,
+                'binary_percent': binary_size / total_size * 100 if total_size > 0 else 0
+            }
+        except Exception:
+            return None
+
+
+class MphContents(NamedTuple):
+    """Everything the UI reads from one .mph file"""
+    file_list: Tuple[Dict[str, str], ...]
+    parameters: Tuple[Tuple[str, str, str], ...]
+    model_info: Optional[Dict[str, str]]
+
+
+@lru_cache(maxsize=128)
+def _load_all(path: str, mtime_ns: int) -> MphContents:
+    """
+    Read file list, parameters and model info under one zip handle.
+
+    Cached per path and modification time, so an edited file is re-read.
+
+    Args:
+        path: Path to .mph file
+        mtime_ns: Modification time of the file (cache key only)
+
+    Returns:
+        MphContents for the file
+    """
+    with MphArchive(path) as archive:
+        return MphContents(
+            tuple(archive.iter_file_list()),
+            tuple(archive.parameters()),
+            archive.model_info()
+        )
 
 
 class MphParser:
@@ -14,32 +223,72 @@ class MphParser:
     """
 
     @staticmethod
-    def parse_parameters(xml_content: str) -> List[Tuple[str, str, str]]:
+    def parse_parameters(xml_content: Union[bytes, str]) -> List[Tuple[str, str, str]]:
         """
-        Parse parameters from dmodel.xml content.
+        Parse parameters from dmodel.xml content with a regex scan.
+
+        Used when the XML is not well-formed; values are unescaped to
+        match what the XML parser returns.
 
         Args:
-            xml_content: String content of dmodel.xml
+            xml_content: Content of dmodel.xml (bytes, or str as UTF-8)
 
         Returns:
             List of tuples (name, value, description) for each parameter
         """
         try:
-            # Use regex to find parameter expressions
-            # Pattern matches: <expressions name="param_name" expr="value" descr="description"...
-            pattern = r'<expressions[^>]*name="([^"]*)"[^>]*expr="([^"]*)"[^>]*descr="([^"]*)"'
-            matches = re.findall(pattern, xml_content)
+            if isinstance(xml_content, str):
+                xml_content = xml_content.encode('utf-8')
 
             parameters = []
-            for name, value, desc in matches:
-                # Skip internal/computed parameters and very long expressions
-                if name not in ['currentiter'] and not value.startswith('Triangle') and len(value) < 100:
+            for match in PARAM_RE.finditer(xml_content):
+                name, value, desc = (
+                    unescape(group.decode('utf-8'), {'&quot;': '"'})
+                    for group in match.groups()
+                )
+                if MphParser._keep_parameter(name, value):
                     parameters.append((name, value, desc))
 
             return parameters
         except Exception:
             return []
 
+    @staticmethod
+    def _keep_parameter(name: str, value: str) -> bool:
+        """Skip internal/computed parameters and very long expressions"""
+        return name != 'currentiter' and not value.startswith('Triangle') and len(value) < 100
+
+    @staticmethod
+    def open(mph_path: Path) -> MphArchive:
+        """
+        Open a .mph file for several reads.
+
+        Args:
+            mph_path: Path to .mph file
+
+        Returns:
+            MphArchive (use as a context manager)
+        """
+        return MphArchive(mph_path)
+
+    @staticmethod
+    def load_all(mph_path: Path) -> MphContents:
+        """
+        Load the cached contents of a .mph file, reading it only if it
+        changed since the last load.
+
+        Args:
+            mph_path: Path to .mph file
+
+        Returns:
+            MphContents for the file
+
+        Raises:
+            OSError, zipfile.BadZipFile: If the file cannot be read
+        """
+        path = os.fspath(mph_path)
+        return _load_all(path, os.stat(path).st_mtime_ns)
+
     @staticmethod
     def load_file_list(mph_path: Path) -> List[Dict[str, str]]:
         """
@@ -51,29 +300,10 @@ class MphParser:
         Returns:
             List of dictionaries with file information
         """
-        files = []
         try:
-            with zipfile.ZipFile(mph_path, 'r') as z:
-                for file_info in z.infolist():
-                    size_kb = file_info.file_size / 1024
-                    if size_kb < 1:
-                        size_str = f"{file_info.file_size} B"
-                    else:
-                        size_str = f"{size_kb:.1f} KB"
-
-                    # Determine type and color tag
-                    file_type, tag = MphParser._classify_file(file_info.filename)
-
-                    files.append({
-                        'filename': file_info.filename,
-                        'size': size_str,
-                        'type': file_type,
-                        'tag': tag
-                    })
+            return [dict(f) for f in MphParser.load_all(mph_path).file_list]
         except Exception:
-            pass
-
-        return files
+            return []
 
     @staticmethod
     def _classify_file(filename: str) -> Tuple[str, str]:
@@ -86,20 +316,7 @@ class MphParser:
         Returns:
             Tuple of (file_type_label, color_tag)
         """
-        if filename.endswith('.xml'):
-            return ("Configuration", 'xml')
-        elif filename.endswith('.json'):
-            return ("Metadata", 'json')
-        elif filename.endswith('.mphbin'):
-            return ("Simulation Data", 'binary')
-        elif filename.endswith('.png'):
-            return ("Preview Image", 'image')
-        elif filename.endswith('.txt'):
-            return ("Text Data", 'text')
-        elif filename.endswith('.zip'):
-            return ("Checkpoint", 'archive')
-        else:
-            return ("Data", 'text')
+        return _SUFFIX_MAP.get(filename[filename.rfind('.'):], _DEFAULT_CLASS)
 
     @staticmethod
     def load_model_info(mph_path: Path) -> Optional[Dict[str, str]]:
@@ -113,34 +330,8 @@ class MphParser:
             Dictionary with model info or None if loading fails
         """
         try:
-            with zipfile.ZipFile(mph_path, 'r') as z:
-                # Read version
-                fileversion = z.read('fileversion').decode('utf-8', errors='ignore').strip()
-
-                # Read model info XML
-                modelinfo = z.read('modelinfo.xml').decode('utf-8')
-                root = ET.fromstring(modelinfo)
-                title = root.get('title', 'N/A')
-                description = root.get('description', 'N/A')
-
-                # Calculate sizes
-                total_size = sum(f.file_size for f in z.infolist())
-                text_size = sum(f.file_size for f in z.infolist()
-                               if f.filename.endswith(('.xml', '.json', '.txt')))
-                binary_size = sum(f.file_size for f in z.infolist()
-                                 if f.filename.endswith('.mphbin'))
-
-                return {
-                    'version': fileversion,
-                    'title': title,
-                    'description': description,
-                    'file_count': len(z.namelist()),
-                    'total_size_mb': total_size / 1024 / 1024,
-                    'text_size_mb': text_size / 1024 / 1024,
-                    'binary_size_mb': binary_size / 1024 / 1024,
-                    'text_percent': text_size / total_size * 100 if total_size > 0 else 0,
-                    'binary_percent': binary_size / total_size * 100 if total_size > 0 else 0
-                }
+            model_info = MphParser.load_all(mph_path).model_info
+            return dict(model_info) if model_info else None
         except Exception:
             return None
 
@@ -156,8 +347,6 @@ class MphParser:
             List of tuples (name, value, description)
         """
         try:
-            with zipfile.ZipFile(mph_path, 'r') as z:
-                dmodel_content = z.read('dmodel.xml').decode('utf-8')
-                return MphParser.parse_parameters(dmodel_content)
+            return list(MphParser.load_all(mph_path).parameters)
         except Exception:
             return []
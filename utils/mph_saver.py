@@ -1,12 +1,59 @@
 """
 MPH file saving and modification utilities
 """
+import mmap
+import os
 import re
-import zipfile
-import tempfile
 import shutil
+import struct
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+from xml.sax.saxutils import escape
+
+
+# Local file header field indexes and general purpose flag (see zipfile)
+_FH_FILENAME_LENGTH = 10
+_FH_EXTRA_FIELD_LENGTH = 11
+_DATA_DESCRIPTOR_FLAG = 0x08
+
+# A name="..." attribute followed (in the same tag) by expr="..."; steps over whole
+# attributes in between, so nothing backtracks into attribute values and
+# attributes merely ending in "expr" are not matched.
+# Groups: 1 = parameter name, 2 = expr value
+_ATTR_RE = re.compile(rb'(?<=\s)name="([^"]*)"(?:\s+[^\s=>]+="[^"]*")*?\s+expr="([^"]*)"')
+
+
+class DModel(NamedTuple):
+    """dmodel.xml of an archive with the location of every expr value"""
+    content: bytes
+    spans: Dict[bytes, List[Tuple[int, int]]]
+
+
+@lru_cache(maxsize=4)
+def _load_dmodel(path: str, mtime_ns: int) -> DModel:
+    """
+    Read dmodel.xml and index its expr values by parameter name.
+
+    Cached per path and modification time, so repeated saves of the same
+    original skip both decompression and the regex scan.
+
+    Args:
+        path: Path to .mph file
+        mtime_ns: Modification time of the file (cache key only)
+
+    Returns:
+        DModel with the raw UTF-8 bytes and the expr value spans
+    """
+    with zipfile.ZipFile(path, 'r') as zin:
+        content = zin.read('dmodel.xml')
+    spans = {}
+    for m in _ATTR_RE.finditer(content):
+        spans.setdefault(m.group(1), []).append(m.span(2))
+    return DModel(content, spans)
 
 
 class MphSaver:
@@ -17,61 +64,267 @@ class MphSaver:
     @staticmethod
     def save_modified_mph(
         mph_path: Path,
-        parameters: Dict[str, str]
+        parameters: Dict[str, str],
+        compresslevel: int = 1
     ) -> Tuple[bool, str, Path, Path]:
         """
         Save modified parameters back to a new .mph file.
 
         Args:
             mph_path: Original .mph file path
-            parameters: Dictionary of {parameter_name: new_value}
+            parameters: Dictionary of {parameter_name: new_value}; values
+                that are not strings are saved as str(value)
+            compresslevel: zlib level (0-9) for the rewritten dmodel.xml;
+                the default favors speed since the copy is a working file
 
         Returns:
-            Tuple of (success, message, new_mph_path, backup_path)
+            Tuple of (success, message, new_mph_path, backup_path); when no
+            value differs from the file nothing is written and the original
+            path is returned with no backup
         """
-        try:
-            # Create temp directory for extraction
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Extract mph file
-                with zipfile.ZipFile(mph_path, 'r') as z:
-                    z.extractall(temp_path)
+        if not parameters:
+            return (True, "No changes", mph_path, None)
 
-                # Update dmodel.xml
-                dmodel_path = temp_path / 'dmodel.xml'
-                if not dmodel_path.exists():
+        try:
+            with zipfile.ZipFile(mph_path, 'r') as zin:
+                try:
+                    dmodel_info = zin.getinfo('dmodel.xml')
+                except KeyError:
                     return (False, "Could not find dmodel.xml in file", None, None)
 
-                content = dmodel_path.read_text(encoding='utf-8')
+                # Edit the raw UTF-8 bytes; only names and values are encoded
+                dmodel = _load_dmodel(str(mph_path), os.fstat(zin.fp.fileno()).st_mtime_ns)
 
-                # Update each parameter using regex
-                for param_name, new_value in parameters.items():
-                    pattern = f'(name="{param_name}"[^>]*expr=")([^"]*)(")'
-                    replacement = f'\\g<1>{new_value}\\g<3>'
-                    content = re.sub(pattern, replacement, content)
+                # Update all parameters at their indexed spans; values are read
+                # unescaped from the XML, so escape them back (numbers are
+                # written as their str())
+                values = {
+                    str(name).encode('utf-8'):
+                        escape(str(value), {'"': '&quot;'}).encode('utf-8')
+                    for name, value in parameters.items()
+                }
+                content, changed = MphSaver._substitute(values, dmodel)
+                if not changed:
+                    # Skip the backup and re-pack on a save without edits
+                    return (True, "No changes", mph_path, None)
 
-                dmodel_path.write_text(content, encoding='utf-8')
+                # Compress the patched XML on a worker thread (zlib releases
+                # the GIL) while the backup is made
+                dmodel_type = (
+                    zipfile.ZIP_STORED if dmodel_info.compress_type == zipfile.ZIP_STORED
+                    else zipfile.ZIP_DEFLATED
+                )
+                with ThreadPoolExecutor(max_workers=1) as pool:
+                    packed = pool.submit(
+                        MphSaver._compress, content, dmodel_type, compresslevel
+                    )
 
-                # Create backup of original
-                backup_path = mph_path.parent / f"{mph_path.stem}_backup.mph"
-                shutil.copy2(mph_path, backup_path)
+                    # Create backup of original
+                    backup_path = mph_path.parent / f"{mph_path.stem}_backup.mph"
+                    MphSaver._snapshot(mph_path, backup_path)
 
-                # Create new modified file
-                new_mph = mph_path.parent / f"{mph_path.stem}_modified.mph"
+                    packed_content = packed.result()
 
-                # Re-pack as ZIP
-                with zipfile.ZipFile(new_mph, 'w', zipfile.ZIP_DEFLATED) as z:
-                    for file_path in temp_path.rglob('*'):
-                        if file_path.is_file():
-                            arcname = file_path.relative_to(temp_path)
-                            z.write(file_path, arcname)
+                # Create new modified file; every other entry is copied still
+                # compressed, straight from a read-only map of the original
+                new_mph = mph_path.parent / f"{mph_path.stem}_modified.mph"
+                with mmap.mmap(zin.fp.fileno(), 0, access=mmap.ACCESS_READ) as src, \
+                        zipfile.ZipFile(
+                            new_mph, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel
+                        ) as zout:
+                    for info in zin.infolist():
+                        if info.is_dir():
+                            continue
+                        out_info = MphSaver._entry_info(info)
+                        if info is dmodel_info:
+                            out_info.compress_type = dmodel_type
+                            out_info.CRC = zlib.crc32(content)
+                            out_info.file_size = len(content)
+                            out_info.compress_size = len(packed_content)
+                            MphSaver._write_raw(zout, out_info, (packed_content,))
+                        else:
+                            MphSaver._copy_entry(src, zout, info, out_info)
 
                 return (True, "Success", new_mph, backup_path)
 
         except Exception as e:
             return (False, str(e), None, None)
 
+    @staticmethod
+    def _snapshot(source: Path, backup_path: Path):
+        """
+        Make backup_path a copy of source, replacing any older backup.
+
+        The backup is an independent copy: a hard link would share the
+        original's data, so any in-place write to the original (Comsol
+        saving over it, an export to the same path) would change the
+        backup too. A separate copy that is still current is kept as is:
+        same size and modification time, and the original has not
+        changed (st_ctime) since the copy was made, which also catches
+        same-size edits within the timestamp granularity.
+
+        Args:
+            source: File to back up
+            backup_path: Backup location
+        """
+        try:
+            backup_stat = os.stat(backup_path)
+        except FileNotFoundError:
+            pass
+        else:
+            source_stat = os.stat(source)
+            if (
+                not os.path.samestat(source_stat, backup_stat)
+                and backup_stat.st_size == source_stat.st_size
+                and backup_stat.st_mtime_ns == source_stat.st_mtime_ns
+                and source_stat.st_ctime_ns <= backup_stat.st_ctime_ns
+            ):
+                return
+            # Unlink first: copying onto a hard link to the original would
+            # truncate the original itself
+            os.unlink(backup_path)
+        shutil.copy2(source, backup_path)
+
+    @staticmethod
+    def _entry_info(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+        """
+        Build the header for an entry copied into the new archive.
+
+        Keeps name, timestamp, permissions and compression method; sizes
+        and CRC are filled in when the entry is written.
+
+        Args:
+            info: Entry of the source archive
+
+        Returns:
+            Fresh ZipInfo for the destination archive
+        """
+        out_info = zipfile.ZipInfo(info.filename, info.date_time)
+        out_info.compress_type = info.compress_type
+        out_info.external_attr = info.external_attr
+        return out_info
+
+    @staticmethod
+    def _copy_entry(
+        src: mmap.mmap,
+        zout: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        out_info: zipfile.ZipInfo
+    ):
+        """
+        Copy one unchanged entry's compressed bytes to the new archive.
+
+        The data is neither decompressed nor recompressed: the CRC and
+        sizes are taken from the source header, a local header is written
+        for them and the raw stream is written behind it directly from the
+        mapped source, without an intermediate read buffer.
+
+        Args:
+            src: Read-only map of the source archive
+            zout: Destination archive (not currently writing another entry)
+            info: Entry to copy
+            out_info: Header for the copied entry
+        """
+        # Locate the raw data behind the source's local header
+        header_end = info.header_offset + zipfile.sizeFileHeader
+        header = src[info.header_offset:header_end]
+        if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile(f"Bad local header for {info.filename}")
+        fields = struct.unpack(zipfile.structFileHeader, header)
+        data_start = header_end + fields[_FH_FILENAME_LENGTH] + fields[_FH_EXTRA_FIELD_LENGTH]
+        data_end = data_start + info.compress_size
+        if data_end > len(src):
+            raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+
+        # Sizes go in the local header, so no data descriptor follows
+        out_info.flag_bits = info.flag_bits & ~_DATA_DESCRIPTOR_FLAG
+        out_info.CRC = info.CRC
+        out_info.compress_size = info.compress_size
+        out_info.file_size = info.file_size
+
+        # The view is released on exit so the map can be closed afterwards
+        with memoryview(src)[data_start:data_end] as data:
+            MphSaver._write_raw(zout, out_info, (data,))
+
+    @staticmethod
+    def _write_raw(zout: zipfile.ZipFile, out_info: zipfile.ZipInfo, chunks: Iterable[bytes]):
+        """
+        Append an already-compressed entry to the destination archive.
+
+        zipfile has no public API for this, so the write position and entry
+        list are updated the same way ZipFile.writestr() does.
+
+        Args:
+            zout: Destination archive (not currently writing another entry)
+            out_info: Header with CRC, sizes and compression method set
+            chunks: Compressed data
+        """
+        zout.fp.seek(zout.start_dir)
+        out_info.header_offset = zout.fp.tell()
+        zout.fp.write(out_info.FileHeader())
+        for chunk in chunks:
+            zout.fp.write(chunk)
+
+        zout.filelist.append(out_info)
+        zout.NameToInfo[out_info.filename] = out_info
+        zout.start_dir = zout.fp.tell()
+        zout._didModify = True
+
+    @staticmethod
+    def _compress(data: bytes, compress_type: int, compresslevel: int) -> bytes:
+        """
+        Compress data as a raw zip entry stream.
+
+        Args:
+            data: Uncompressed entry data
+            compress_type: zipfile.ZIP_STORED or zipfile.ZIP_DEFLATED
+            compresslevel: zlib compression level
+
+        Returns:
+            Entry data as stored in the archive
+        """
+        if compress_type == zipfile.ZIP_STORED:
+            return data
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+        return compressor.compress(data) + compressor.flush()
+
+    @staticmethod
+    def _substitute(values: Dict[bytes, bytes], dmodel: DModel) -> Tuple[bytes, int]:
+        """
+        Replace the expr value of every listed parameter.
+
+        Only the indexed spans of the listed names are visited; unchanged
+        slices and replacements are appended to a single bytearray,
+        converted to bytes once at the end. Values already equal to the
+        encoded new value are left alone.
+
+        Args:
+            values: Encoded new values keyed by encoded parameter name
+            dmodel: Indexed dmodel.xml
+
+        Returns:
+            Tuple of (patched dmodel.xml bytes, number of values changed)
+        """
+        content = dmodel.content
+        edits = sorted(
+            (start, end, new_value)
+            for name, new_value in values.items()
+            for start, end in dmodel.spans.get(name, ())
+            if content[start:end] != new_value
+        )
+        if not edits:
+            return content, 0
+
+        out = bytearray()
+        last = 0
+        for start, end, new_value in edits:
+            # Keep everything up to the opening quote, swap the old value
+            out += content[last:start]
+            out += new_value
+            last = end
+        out += content[last:]
+        return bytes(out), len(edits)
+
     @staticmethod
     def extract_mph(mph_path: Path, extract_dir: Path) -> Tuple[bool, str, int]:
         """
@@ -91,7 +344,10 @@ class MphSaver:
             with zipfile.ZipFile(mph_path, 'r') as z:
                 z.extractall(extract_path)
 
-            file_count = len(list(extract_path.rglob('*')))
+            # Count files with a plain walk (no Path object or list per entry)
+            file_count = 0
+            for _, _, files in os.walk(extract_path):
+                file_count += len(files)
             return (True, str(extract_path), file_count)
 
         except Exception as e:
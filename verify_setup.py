@@ -8,6 +8,8 @@ Run this before starting the main application for the first time.
 
 import sys
 import subprocess
+from importlib.util import find_spec
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -48,10 +50,8 @@ def check_python_version():
     return passed
 
 
-def check_pip():
-    """Check if pip is available"""
-    print_header("Package Manager Check")
-    
+def probe_pip():
+    """Return the pip version line, or None if pip is not available"""
     try:
         result = subprocess.run(
             [sys.executable, "-m", "pip", "--version"],
@@ -59,20 +59,30 @@ def check_pip():
             text=True,
             check=True
         )
-        print_check("pip available", True, result.stdout.strip())
-        return True
+        return result.stdout.strip()
     except subprocess.CalledProcessError:
-        print_check("pip available", False, "pip not found")
-        return False
+        return None
 
 
-def check_module(module_name):
-    """Check if a Python module is installed"""
-    try:
-        __import__(module_name)
+def check_pip(version):
+    """Check if pip is available (version comes from probe_pip)"""
+    print_header("Package Manager Check")
+    
+    if version is not None:
+        print_check("pip available", True, version)
         return True
-    except ImportError:
-        return False
+    print_check("pip available", False, "pip not found")
+    return False
+
+
+# The tkinter package is pure Python and is found even when the Tk
+# bindings (python3-tk on Linux) are missing, so look for those instead
+MODULE_SPECS = {'tkinter': '_tkinter'}
+
+
+def check_module(module_name):
+    """Check if a Python module is installed (without importing it)"""
+    return find_spec(MODULE_SPECS.get(module_name, module_name)) is not None
 
 
 def check_required_modules():
@@ -104,10 +114,8 @@ def check_required_modules():
     return all_passed
 
 
-def check_java():
-    """Check if Java is available (required for mph/JPype)"""
-    print_header("Java Runtime Environment Check")
-    
+def probe_java():
+    """Return the Java version line, or None if Java is not available"""
     try:
         result = subprocess.run(
             ["java", "-version"],
@@ -116,10 +124,19 @@ def check_java():
             check=True
         )
         # Java prints version to stderr
-        version_info = result.stderr.split('\n')[0] if result.stderr else "Unknown"
+        return result.stderr.split('\n')[0] if result.stderr else "Unknown"
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+
+def check_java(version_info):
+    """Check if Java is available (required for mph/JPype)"""
+    print_header("Java Runtime Environment Check")
+    
+    if version_info is not None:
         print_check("Java available", True, version_info)
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    else:
         print_check("Java available", False, "Java not found")
         print("     Required for mph library (JPype bridge)")
         print("     Usually installed with Comsol Multiphysics")
@@ -262,11 +279,17 @@ def main():
     
     results = {}
     
-    # Run all checks
-    results['python'] = check_python_version()
-    results['pip'] = check_pip()
-    results['modules'] = check_required_modules()
-    results['java'] = check_java()
+    # Start the subprocess probes in the background so they overlap with
+    # the other checks; results are still printed in order below
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        pip_probe = pool.submit(probe_pip)
+        java_probe = pool.submit(probe_java)
+        
+        # Run all checks
+        results['python'] = check_python_version()
+        results['pip'] = check_pip(pip_probe.result())
+        results['modules'] = check_required_modules()
+        results['java'] = check_java(java_probe.result())
     results['comsol'] = check_comsol()
     results['structure'] = check_project_structure()
     results['permissions'] = check_permissions()